@@ -0,0 +1,41 @@
+"""Shared in-process CLI runners for the test suite.
+
+Importing the CLI modules once here lets every test module reuse the same
+loaded module tree, so the import cost is paid a single time per test
+process instead of once per CLI invocation.
+"""
+
+from contextlib import redirect_stderr, redirect_stdout
+import io
+import logging
+import os
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import tree_builder.main
+import tree_rag.main
+
+
+def run_tree_builder_cli(args: list[str], env: dict[str, str] | None = None) -> SimpleNamespace:
+    """Invoke the tree_builder CLI in-process and capture its output."""
+    out = io.StringIO()
+    err = io.StringIO()
+    with patch.dict(os.environ, env or {}, clear=(env is not None)):
+        with redirect_stdout(out), redirect_stderr(err):
+            code = tree_builder.main.run_cli(args)
+    return SimpleNamespace(returncode=code, stdout=out.getvalue(), stderr=err.getvalue())
+
+
+def run_tree_rag_cli(args: list[str]) -> SimpleNamespace:
+    """Invoke the tree_rag CLI in-process and capture its output."""
+    out = io.StringIO()
+    err = io.StringIO()
+    try:
+        with redirect_stdout(out), redirect_stderr(err):
+            code = tree_rag.main.run_cli(args)
+    finally:
+        # run_cli reconfigures the root logger onto the redirected stream;
+        # point it back at the real stderr before the buffers are discarded.
+        logging.basicConfig(level=logging.WARNING, stream=sys.__stderr__, force=True)
+    return SimpleNamespace(returncode=code, stdout=out.getvalue(), stderr=err.getvalue())
@@ -0,0 +1,15 @@
+"""Pytest bootstrap: warm heavy imports once per worker process.
+
+Under pytest-xdist each worker pays the first-test cold import of the CLI
+module trees (argparse wiring, numpy, tree_builder + tree_rag packages).
+Importing them at collection time moves that cost out of the first test's
+reported duration and shares it across the whole worker session.
+
+The suite is safe to shard across processes (`pytest -n auto`): every test
+class that touches the filesystem allocates its own TemporaryDirectory in
+setUpClass, and the remaining module-level fixtures are read-only constants,
+so workers never contend on shared paths or mutable state.
+"""
+
+import tree_builder.main  # noqa: F401
+import tree_rag.main  # noqa: F401
@@ -1,6 +1,7 @@
 ﻿import unittest
 
 from tree_builder.llm_corrector import (
+    LLMLevelSuggestion,
     llm_infer_partial,
     merge_llm_corrections,
 )
@@ -70,8 +71,8 @@ class LLMCorrectorTests(unittest.TestCase):
         merged = merge_llm_corrections(
             rule_results=rule_results,
             llm_results={
-                0: type("S", (), {"index": 0, "level": 3, "reasoning": "conflict"})(),
-                1: type("S", (), {"index": 1, "level": 2, "reasoning": "better"})(),
+                0: LLMLevelSuggestion(index=0, level=3, reasoning="conflict"),
+                1: LLMLevelSuggestion(index=1, level=2, reasoning="better"),
             },
         )
 
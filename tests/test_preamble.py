@@ -44,18 +44,26 @@ We presented AdaRouter, demonstrating significant improvements over static metho
 """
 
 
+SUMMARIZER = MockSummarizer(max_chars=120)
+
+
 class PreambleTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Built once per class; the injection test below is the only mutator.
+        cls.tree, cls.report = build_robust_tree(SAMPLE_MARKDOWN, doc_id="paper", llm_client=None)
+
     def test_inject_preamble_nodes_and_counts(self) -> None:
-        tree, _ = build_robust_tree(SAMPLE_MARKDOWN, doc_id="paper", llm_client=None)
+        tree = self.tree
         self.assertEqual(tree.node_count, 11)
         self.assertEqual(tree.leaf_count, 8)
 
-        generate_summaries(tree, MockSummarizer(max_chars=120))
+        generate_summaries(tree, SUMMARIZER)
         injected = inject_preamble_leaves(tree.root)
-        generate_preamble_summaries(tree.root, MockSummarizer(max_chars=120))
+        generate_preamble_summaries(tree.root, SUMMARIZER, nodes=injected)
         tree.recompute_counts()
 
-        self.assertEqual(injected, 3)
+        self.assertEqual(len(injected), 3)
         self.assertEqual(tree.node_count, 14)
         self.assertEqual(tree.leaf_count, 11)
 
@@ -63,9 +71,10 @@ class PreambleTests(unittest.TestCase):
         self.assertIn("Abstract", top_headings)
         self.assertIn("4 Conclusion", top_headings)
 
-        intro = next(node for node in tree.root.children if node.heading == "1 Introduction")
-        methods = next(node for node in tree.root.children if node.heading == "2 Methods")
-        experiments = next(node for node in tree.root.children if node.heading == "3 Experiments")
+        children_by_heading = {node.heading: node for node in tree.root.children}
+        intro = children_by_heading["1 Introduction"]
+        methods = children_by_heading["2 Methods"]
+        experiments = children_by_heading["3 Experiments"]
 
         for parent in (intro, methods, experiments):
             self.assertFalse(parent.is_leaf)
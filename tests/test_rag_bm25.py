@@ -0,0 +1,45 @@
+import pickle
+import unittest
+
+from tree_rag.indexing.bm25_builder import FallbackBM25
+
+
+_DOCS = [
+    ["alpha", "beta", "gamma"],
+    ["beta", "delta"],
+    ["gamma", "gamma", "epsilon"],
+]
+
+
+class FallbackBM25Tests(unittest.TestCase):
+    def test_pickle_roundtrip_preserves_scores(self) -> None:
+        index = FallbackBM25(_DOCS)
+        restored = pickle.loads(pickle.dumps(index))
+        self.assertEqual(restored.get_scores(["gamma"]), index.get_scores(["gamma"]))
+
+    def test_old_layout_state_rebuilds_derived_structures(self) -> None:
+        # Indexes saved before the postings/IDF precomputation pickled the raw
+        # instance __dict__; unpickling applies that dict via __setstate__, so
+        # scoring must work from the old attribute set alone.
+        old_state = {
+            "tokenized_docs": _DOCS,
+            "k1": 1.5,
+            "b": 0.75,
+            "doc_count": len(_DOCS),
+            "avgdl": sum(len(doc) for doc in _DOCS) / len(_DOCS),
+            "doc_freq": {"alpha": 1, "beta": 2, "gamma": 2, "delta": 1, "epsilon": 1},
+            "term_freq": [
+                {"alpha": 1, "beta": 1, "gamma": 1},
+                {"beta": 1, "delta": 1},
+                {"gamma": 2, "epsilon": 1},
+            ],
+        }
+        restored = FallbackBM25.__new__(FallbackBM25)
+        restored.__setstate__(old_state)
+
+        fresh = FallbackBM25(_DOCS)
+        self.assertEqual(restored.get_scores(["gamma", "beta"]), fresh.get_scores(["gamma", "beta"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,26 +1,15 @@
 from pathlib import Path
 import json
-import subprocess
-import sys
 import tempfile
 import unittest
 
-
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
+from cli_harness import run_tree_rag_cli as _run_cli
 
 
-def _run_cli(args: list[str]) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(
-        [sys.executable, "-m", "tree_rag.main", *args],
-        cwd=PROJECT_ROOT,
-        capture_output=True,
-        text=True,
-        check=False,
-    )
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
 
-def _tree_json_text() -> str:
-    return """{
+_TREE_JSON_TEXT = """{
   "doc_id": "sample",
   "node_count": 2,
   "leaf_count": 2,
@@ -59,52 +48,61 @@ def _tree_json_text() -> str:
 
 
 class RagCliTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._tmpdir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls._tmpdir.cleanup)
+        cls.tmp_path = Path(cls._tmpdir.name)
+
+    def _case_dir(self) -> Path:
+        case_dir = self.tmp_path / self._testMethodName
+        case_dir.mkdir(exist_ok=True)
+        return case_dir
+
     def test_index_then_query_in_mock_mode(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            input_tree = tmp_path / "sample.tree.json"
-            output_dir = tmp_path / "index"
-            input_tree.write_text(_tree_json_text(), encoding="utf-8")
-
-            index_result = _run_cli(
-                ["index", "--input", str(input_tree), "--output", str(output_dir), "--mock"]
-            )
-            self.assertEqual(index_result.returncode, 0, msg=index_result.stderr)
-            self.assertTrue((output_dir / "metadata.json").exists())
-
-            query_result = _run_cli(
-                [
-                    "query",
-                    "--index",
-                    str(output_dir),
-                    "--query",
-                    "AdaRouter 的核心机制是什么？",
-                    "--mock",
-                ]
-            )
-            self.assertEqual(query_result.returncode, 0, msg=query_result.stderr)
-            self.assertIn("Step 1: Node Locating", query_result.stdout)
-            self.assertIn("Step 3: Answer", query_result.stdout)
+        case_dir = self._case_dir()
+        input_tree = case_dir / "sample.tree.json"
+        output_dir = case_dir / "index"
+        input_tree.write_text(_TREE_JSON_TEXT, encoding="utf-8")
+
+        index_result = _run_cli(
+            ["index", "--input", str(input_tree), "--output", str(output_dir), "--mock"]
+        )
+        self.assertEqual(index_result.returncode, 0, msg=index_result.stderr)
+        self.assertTrue((output_dir / "metadata.json").exists())
+
+        query_result = _run_cli(
+            [
+                "query",
+                "--index",
+                str(output_dir),
+                "--query",
+                "AdaRouter 的核心机制是什么？",
+                "--mock",
+            ]
+        )
+        self.assertEqual(query_result.returncode, 0, msg=query_result.stderr)
+        self.assertIn("Step 1: Node Locating", query_result.stdout)
+        self.assertIn("Step 3: Answer", query_result.stdout)
 
     def test_index_from_markdown_in_mock_mode(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            input_md = tmp_path / "sample.md"
-            output_dir = tmp_path / "index_md"
-            input_md.write_text(
-                "# Intro\nLightRAG improves retrieval.\n\n# Methods\nDual-level retrieval overview.\n\n## Local Retrieval\nUses local keywords.\n\n## Global Retrieval\nUses global context.\n",
-                encoding="utf-8",
-            )
-
-            index_result = _run_cli(
-                ["index", "--input", str(input_md), "--output", str(output_dir), "--mock"]
-            )
-            self.assertEqual(index_result.returncode, 0, msg=index_result.stderr)
-            self.assertTrue((output_dir / "metadata.json").exists())
-
-            metadata = json.loads((output_dir / "metadata.json").read_text(encoding="utf-8"))
-            node_ids = set(metadata["node_chunk_ids"].keys())
-            self.assertTrue(any(node_id.endswith("_preamble") for node_id in node_ids))
+        case_dir = self._case_dir()
+        input_md = case_dir / "sample.md"
+        output_dir = case_dir / "index_md"
+        input_md.write_text(
+            "# Intro\nLightRAG improves retrieval.\n\n# Methods\nDual-level retrieval overview.\n\n## Local Retrieval\nUses local keywords.\n\n## Global Retrieval\nUses global context.\n",
+            encoding="utf-8",
+        )
+
+        index_result = _run_cli(
+            ["index", "--input", str(input_md), "--output", str(output_dir), "--mock"]
+        )
+        self.assertEqual(index_result.returncode, 0, msg=index_result.stderr)
+        self.assertTrue((output_dir / "metadata.json").exists())
+
+        metadata = json.loads((output_dir / "metadata.json").read_bytes())
+        node_ids = set(metadata["node_chunk_ids"].keys())
+        self.assertTrue(any(node_id.endswith("_preamble") for node_id in node_ids))
 
 
 if __name__ == "__main__":
@@ -8,41 +8,40 @@ from tree_rag.indexing.chunker import chunk_content
 from tree_rag.indexing.index_store import build_index_from_tree, load_index, load_tree_input, save_index
 
 
-def _sample_tree() -> dict:
-    return {
-        "doc_id": "sample_doc",
-        "tree": {
-            "node_id": "root",
-            "heading": "ROOT",
-            "level": 0,
-            "summary": "",
-            "content": "",
-            "heading_path": "",
-            "is_leaf": False,
-            "children": [
-                {
-                    "node_id": "n1",
-                    "heading": "Methods",
-                    "level": 1,
-                    "summary": "Method summary",
-                    "content": "Alpha beta gamma.\n\nDelta epsilon zeta.",
-                    "heading_path": "Methods",
-                    "is_leaf": True,
-                    "children": [],
-                },
-                {
-                    "node_id": "n2",
-                    "heading": "Results",
-                    "level": 1,
-                    "summary": "Result summary",
-                    "content": "Accuracy reaches 73.2% in EUR/USD experiments.",
-                    "heading_path": "Results",
-                    "is_leaf": True,
-                    "children": [],
-                },
-            ],
-        },
-    }
+_SAMPLE_TREE = {
+    "doc_id": "sample_doc",
+    "tree": {
+        "node_id": "root",
+        "heading": "ROOT",
+        "level": 0,
+        "summary": "",
+        "content": "",
+        "heading_path": "",
+        "is_leaf": False,
+        "children": [
+            {
+                "node_id": "n1",
+                "heading": "Methods",
+                "level": 1,
+                "summary": "Method summary",
+                "content": "Alpha beta gamma.\n\nDelta epsilon zeta.",
+                "heading_path": "Methods",
+                "is_leaf": True,
+                "children": [],
+            },
+            {
+                "node_id": "n2",
+                "heading": "Results",
+                "level": 1,
+                "summary": "Result summary",
+                "content": "Accuracy reaches 73.2% in EUR/USD experiments.",
+                "heading_path": "Results",
+                "is_leaf": True,
+                "children": [],
+            },
+        ],
+    },
+}
 
 
 class ChunkerTests(unittest.TestCase):
@@ -54,21 +53,31 @@ class ChunkerTests(unittest.TestCase):
 
 
 class IndexStoreTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.config = load_rag_config(load_dotenv=False)
+        cls._tmpdir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls._tmpdir.cleanup)
+        cls.tmp_path = Path(cls._tmpdir.name)
+
+    def _case_dir(self) -> Path:
+        case_dir = self.tmp_path / self._testMethodName
+        case_dir.mkdir(exist_ok=True)
+        return case_dir
+
     def test_build_save_load_roundtrip(self) -> None:
-        config = load_rag_config(load_dotenv=False)
-        tree = _sample_tree()
-        index = build_index_from_tree(tree, config=config, mock=True)
+        tree = _SAMPLE_TREE
+        index = build_index_from_tree(tree, config=self.config, mock=True)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir) / "index"
-            save_index(index, output_dir)
+        output_dir = self._case_dir() / "index"
+        save_index(index, output_dir)
 
-            self.assertTrue((output_dir / "metadata.json").exists())
-            self.assertTrue((output_dir / "chunks.jsonl").exists())
-            self.assertTrue((output_dir / "embeddings.npy").exists())
-            self.assertTrue((output_dir / "bm25.pkl").exists())
+        self.assertTrue((output_dir / "metadata.json").exists())
+        self.assertTrue((output_dir / "chunks.jsonl").exists())
+        self.assertTrue((output_dir / "embeddings.npy").exists())
+        self.assertTrue((output_dir / "bm25.pkl").exists())
 
-            loaded = load_index(output_dir)
+        loaded = load_index(output_dir)
 
         self.assertEqual(loaded.doc_id, index.doc_id)
         self.assertEqual(set(loaded.nodes.keys()), set(index.nodes.keys()))
@@ -76,14 +85,12 @@ class IndexStoreTests(unittest.TestCase):
         self.assertTrue(loaded.tree)
 
     def test_metadata_is_json(self) -> None:
-        config = load_rag_config(load_dotenv=False)
-        tree = _sample_tree()
-        index = build_index_from_tree(tree, config=config, mock=True)
+        tree = _SAMPLE_TREE
+        index = build_index_from_tree(tree, config=self.config, mock=True)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir) / "index"
-            save_index(index, output_dir)
-            metadata = json.loads((output_dir / "metadata.json").read_text(encoding="utf-8"))
+        output_dir = self._case_dir() / "index"
+        save_index(index, output_dir)
+        metadata = json.loads((output_dir / "metadata.json").read_bytes())
 
         self.assertEqual(metadata["doc_id"], "sample_doc")
         self.assertGreater(metadata["chunk_count"], 0)
@@ -98,13 +105,11 @@ Encoder details.
 ## Router
 Router details.
 """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            md_path = Path(tmpdir) / "paper.md"
-            md_path.write_text(markdown, encoding="utf-8")
+        md_path = self._case_dir() / "paper.md"
+        md_path.write_text(markdown, encoding="utf-8")
 
-            tree_data = load_tree_input(md_path)
-            config = load_rag_config(load_dotenv=False)
-            index = build_index_from_tree(tree_data=tree_data, config=config, mock=True)
+        tree_data = load_tree_input(md_path)
+        index = build_index_from_tree(tree_data=tree_data, config=self.config, mock=True)
 
         preamble_nodes = [node_id for node_id in index.nodes if node_id.endswith("_preamble")]
         self.assertTrue(preamble_nodes)
@@ -12,55 +12,57 @@ class _FakeClient:
         return self.payload
 
 
-def _tree() -> dict:
-    return {
-        "doc_id": "d1",
-        "tree": {
-            "node_id": "root",
-            "heading": "ROOT",
-            "level": 0,
-            "summary": "",
-            "content": "",
-            "heading_path": "",
-            "is_leaf": False,
-            "children": [
-                {
-                    "node_id": "n1",
-                    "heading": "Intro",
-                    "level": 1,
-                    "summary": "overview",
-                    "content": "",
-                    "heading_path": "Intro",
-                    "is_leaf": True,
-                    "children": [],
-                },
-                {
-                    "node_id": "n2",
-                    "heading": "Methods",
-                    "level": 1,
-                    "summary": "contains contextual bandit",
-                    "content": "",
-                    "heading_path": "Methods",
-                    "is_leaf": True,
-                    "children": [],
-                },
-            ],
-        },
-    }
+_TREE = {
+    "doc_id": "d1",
+    "tree": {
+        "node_id": "root",
+        "heading": "ROOT",
+        "level": 0,
+        "summary": "",
+        "content": "",
+        "heading_path": "",
+        "is_leaf": False,
+        "children": [
+            {
+                "node_id": "n1",
+                "heading": "Intro",
+                "level": 1,
+                "summary": "overview",
+                "content": "",
+                "heading_path": "Intro",
+                "is_leaf": True,
+                "children": [],
+            },
+            {
+                "node_id": "n2",
+                "heading": "Methods",
+                "level": 1,
+                "summary": "contains contextual bandit",
+                "content": "",
+                "heading_path": "Methods",
+                "is_leaf": True,
+                "children": [],
+            },
+        ],
+    },
+}
 
 
 class NodeLocatorTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.config = load_rag_config(load_dotenv=False)
+
     def test_serialize_tree_contains_leaf_marker(self) -> None:
-        serialized = serialize_tree(_tree())
+        serialized = serialize_tree(_TREE)
         self.assertIn("Leaf Node", serialized)
         self.assertIn("[n2] Methods", serialized)
 
     def test_mock_locator_returns_leaf_nodes(self) -> None:
-        config = load_rag_config(load_dotenv=False)
         nodes, thinking = locate_nodes(
             query="contextual bandit 是什么",
-            tree_data=_tree(),
-            config=config,
+            tree_data=_TREE,
+            config=self.config,
             client=None,
             mock=True,
             top_k=3,
@@ -70,12 +72,11 @@ class NodeLocatorTests(unittest.TestCase):
         self.assertTrue(thinking)
 
     def test_invalid_json_falls_back_to_mock(self) -> None:
-        config = load_rag_config(load_dotenv=False)
         client = _FakeClient(payload="not-json")
         nodes, _ = locate_nodes(
             query="methods",
-            tree_data=_tree(),
-            config=config,
+            tree_data=_TREE,
+            config=self.config,
             client=client,
             mock=False,
             top_k=3,
@@ -8,7 +8,7 @@ from tree_rag.utils.openai_client import OpenAICompatibleClient
 
 class _FakeHTTPResponse:
     def __init__(self, payload: dict) -> None:
-        self._payload = payload
+        self._data = json.dumps(payload).encode("utf-8")
 
     def __enter__(self):
         return self
@@ -17,7 +17,12 @@ class _FakeHTTPResponse:
         return False
 
     def read(self) -> bytes:
-        return json.dumps(self._payload).encode("utf-8")
+        return self._data
+
+
+# Shared across tests: _FakeHTTPResponse is immutable after construction, so
+# one embeddings response serves both the happy path and the retry test.
+_EMBEDDINGS_RESPONSE = _FakeHTTPResponse({"data": [{"embedding": [0.1, 0.2]}]})
 
 
 class OpenAIClientTests(unittest.TestCase):
@@ -45,8 +50,7 @@ class OpenAIClientTests(unittest.TestCase):
             base_url="https://example.local/v1",
             timeout_seconds=5.0,
         )
-        payload = {"data": [{"embedding": [0.1, 0.2]}]}
-        with patch("tree_rag.utils.openai_client.request.urlopen", return_value=_FakeHTTPResponse(payload)) as mocked:
+        with patch("tree_rag.utils.openai_client.request.urlopen", return_value=_EMBEDDINGS_RESPONSE) as mocked:
             vectors = client.embeddings(model="embed-v1", texts=["hello"])
         self.assertEqual(vectors, [[0.1, 0.2]])
         req = mocked.call_args.args[0]
@@ -106,10 +110,9 @@ class OpenAIClientTests(unittest.TestCase):
             max_retries=2,
             retry_backoff_seconds=0.0,
         )
-        payload = {"data": [{"embedding": [0.1, 0.2]}]}
         with patch(
             "tree_rag.utils.openai_client.request.urlopen",
-            side_effect=[urlerror.URLError("timed out"), _FakeHTTPResponse(payload)],
+            side_effect=[urlerror.URLError("timed out"), _EMBEDDINGS_RESPONSE],
         ) as mocked:
             vectors = client.embeddings(model="embed-v1", texts=["hello"])
         self.assertEqual(vectors, [[0.1, 0.2]])
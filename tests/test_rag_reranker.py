@@ -1,3 +1,5 @@
+from dataclasses import replace
+import logging
 import unittest
 
 from tree_rag.config import load_rag_config
@@ -20,13 +22,47 @@ class _BadClient:
         raise RuntimeError("boom")
 
 
+class _WarningFlag(logging.Handler):
+    """Cheaper than assertLogs: records whether any warning fired, nothing else."""
+
+    def __init__(self) -> None:
+        super().__init__(level=logging.WARNING)
+        self.hit = False
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.hit = True
+
+
+_BASE_CONFIG = load_rag_config(load_dotenv=False)
+
+
 def _config():
-    config = load_rag_config(load_dotenv=False)
+    config = replace(_BASE_CONFIG)
     config.rerank_diversify = True
     config.rerank_min_unique_nodes = 0
     return config
 
 
+# Shared across all fixture chunks: rerank_chunks rewrites score and
+# retrieval_detail but never touches embeddings.
+_EMB = [0.1]
+
+_TWO_CHUNK_PARAMS = (
+    ("c1", "n1", 0.8),
+    ("c2", "n2", 0.5),
+)
+
+_DOMINATING_PARAMS = (
+    ("n1_c1", "n1", 0.99),
+    ("n1_c2", "n1", 0.97),
+    ("n1_c3", "n1", 0.96),
+    ("n1_c4", "n1", 0.95),
+    ("n1_c5", "n1", 0.94),
+    ("n2_c1", "n2", 0.60),
+    ("n3_c1", "n3", 0.59),
+)
+
+
 def _retrieved(chunk_id: str, node_id: str, score: float) -> RetrievedChunk:
     return RetrievedChunk(
         chunk=Chunk(
@@ -34,7 +70,7 @@ def _retrieved(chunk_id: str, node_id: str, score: float) -> RetrievedChunk:
             text=f"text {chunk_id}",
             source_node_id=node_id,
             heading_path=f"Heading {node_id}",
-            embedding=[0.1],
+            embedding=_EMB,
         ),
         score=score,
         retrieval_detail={"fused_score": score},
@@ -42,22 +78,11 @@ def _retrieved(chunk_id: str, node_id: str, score: float) -> RetrievedChunk:
 
 
 def _two_chunks() -> list[RetrievedChunk]:
-    return [
-        _retrieved("c1", "n1", 0.8),
-        _retrieved("c2", "n2", 0.5),
-    ]
+    return [_retrieved(*params) for params in _TWO_CHUNK_PARAMS]
 
 
 def _dominating_chunks() -> list[RetrievedChunk]:
-    return [
-        _retrieved("n1_c1", "n1", 0.99),
-        _retrieved("n1_c2", "n1", 0.97),
-        _retrieved("n1_c3", "n1", 0.96),
-        _retrieved("n1_c4", "n1", 0.95),
-        _retrieved("n1_c5", "n1", 0.94),
-        _retrieved("n2_c1", "n2", 0.60),
-        _retrieved("n3_c1", "n3", 0.59),
-    ]
+    return [_retrieved(*params) for params in _DOMINATING_PARAMS]
 
 
 class RerankerTests(unittest.TestCase):
@@ -128,7 +153,10 @@ class RerankerTests(unittest.TestCase):
 
     def test_rerank_failure_fallback_still_applies_diversity(self) -> None:
         config = _config()
-        with self.assertLogs("tree_rag.retrieval.reranker", level="WARNING"):
+        flag = _WarningFlag()
+        logger = logging.getLogger("tree_rag.retrieval.reranker")
+        logger.addHandler(flag)
+        try:
             results = rerank_chunks(
                 query="q",
                 retrieved_chunks=_dominating_chunks(),
@@ -137,7 +165,10 @@ class RerankerTests(unittest.TestCase):
                 mock=False,
                 top_k=5,
             )
+        finally:
+            logger.removeHandler(flag)
 
+        self.assertTrue(flag.hit)
         node_ids = [item.chunk.source_node_id for item in results]
         self.assertEqual(len(results), 5)
         self.assertGreaterEqual(len(set(node_ids)), 3)
@@ -11,6 +11,10 @@ class _FakeClient:
 
 
 class SynthesizerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.config = load_rag_config(load_dotenv=False)
+
     def test_build_context_contains_source_paths(self) -> None:
         chunks = [
             RetrievedChunk(
@@ -30,7 +34,6 @@ class SynthesizerTests(unittest.TestCase):
         self.assertIn("Methods > Router Design", context)
 
     def test_mock_synthesis_returns_joined_evidence(self) -> None:
-        config = load_rag_config(load_dotenv=False)
         chunks = [
             RetrievedChunk(
                 chunk=Chunk(
@@ -44,12 +47,11 @@ class SynthesizerTests(unittest.TestCase):
                 retrieval_detail={},
             )
         ]
-        answer = synthesize("question", chunks, config=config, client=None, mock=True)
+        answer = synthesize("question", chunks, config=self.config, client=None, mock=True)
         self.assertIn("Based on retrieved evidence", answer)
         self.assertIn("Source: Methods", answer)
 
     def test_llm_synthesis_uses_client(self) -> None:
-        config = load_rag_config(load_dotenv=False)
         chunks = [
             RetrievedChunk(
                 chunk=Chunk(
@@ -63,7 +65,7 @@ class SynthesizerTests(unittest.TestCase):
                 retrieval_detail={},
             )
         ]
-        answer = synthesize("question", chunks, config=config, client=_FakeClient(), mock=False)
+        answer = synthesize("question", chunks, config=self.config, client=_FakeClient(), mock=False)
         self.assertEqual(answer, "final answer")
 
 
@@ -0,0 +1,31 @@
+import unittest
+from unittest import mock
+
+from tree_rag.utils.ttl_cache import TTLCache
+
+
+class TTLCacheTests(unittest.TestCase):
+    def test_get_set_and_lru_eviction(self) -> None:
+        cache = TTLCache(max_items=2, ttl_seconds=60.0)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+
+        cache.set("c", 3)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_entries_expire_after_ttl(self) -> None:
+        cache = TTLCache(max_items=4, ttl_seconds=60.0)
+        with mock.patch(
+            "tree_rag.utils.ttl_cache.time.monotonic", side_effect=[0.0, 61.0]
+        ):
+            cache.set("a", 1)
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
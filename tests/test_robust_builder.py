@@ -96,11 +96,22 @@ EXPECTED = {
 
 
 class RobustBuilderTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Read and build each fixture once; the subTests below only assert.
+        cls.built = {
+            filename: build_robust_tree(
+                (TEST_DATA_DIR / filename).read_text(encoding="utf-8"),
+                doc_id=filename.replace(".md", ""),
+                llm_client=None,
+            )
+            for filename in EXPECTED
+        }
+
     def test_robust_builder_matrix(self) -> None:
         for filename, expected in EXPECTED.items():
             with self.subTest(filename=filename):
-                markdown = (TEST_DATA_DIR / filename).read_text(encoding="utf-8")
-                tree, report = build_robust_tree(markdown, doc_id=filename.replace(".md", ""), llm_client=None)
+                tree, report = self.built[filename]
 
                 self.assertEqual(tree.node_count, expected["node_count"])
                 self.assertEqual(tree.leaf_count, expected["leaf_count"])
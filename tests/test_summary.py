@@ -16,7 +16,7 @@ from tree_builder.tree import build_document_tree
 
 class _FakeHTTPResponse:
     def __init__(self, payload: dict) -> None:
-        self._payload = payload
+        self._data = json.dumps(payload).encode("utf-8")
 
     def __enter__(self):
         return self
@@ -25,7 +25,7 @@ class _FakeHTTPResponse:
         return False
 
     def read(self) -> bytes:
-        return json.dumps(self._payload).encode("utf-8")
+        return self._data
 
 
 class SummaryTests(unittest.TestCase):
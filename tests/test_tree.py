@@ -1,3 +1,4 @@
+from collections import Counter
 from pathlib import Path
 import unittest
 
@@ -11,12 +12,7 @@ TEST_DATA_DIR = Path(__file__).resolve().parent.parent / "tree_builder" / "test_
 
 
 def _levels_histogram(tree) -> dict[int, int]:
-    histogram: dict[int, int] = {}
-    for node in postorder_nodes(tree.root):
-        if node.level == 0:
-            continue
-        histogram[node.level] = histogram.get(node.level, 0) + 1
-    return histogram
+    return dict(Counter(node.level for node in postorder_nodes(tree.root) if node.level))
 
 
 class TreeBuildTests(unittest.TestCase):
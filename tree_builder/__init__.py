@@ -1,50 +1,51 @@
-﻿"""Tree Builder package."""
-
-from tree_builder.builder import BuildReport, build_document, build_robust_tree
-from tree_builder.parser import HeadingInfo, Section, parse_heading_line, parse_markdown_file, parse_markdown_sections
-from tree_builder.preamble import generate_preamble_summaries, inject_preamble_leaves
-from tree_builder.summary import (
-    LLMSummarizerStub,
-    MockSummarizer,
-    OpenAICompatibleSummarizer,
-    Summarizer,
-    build_llm_summarizer_from_env,
-    generate_summaries,
-)
-from tree_builder.tree import (
-    DocumentTree,
-    TreeNode,
-    build_document_tree,
-    postorder_nodes,
-    traverse_all_nodes,
-    validate_and_fix_tree,
-)
-from tree_builder.visualizer import document_tree_to_dict, export_document_tree_json, print_document_tree
-
-__all__ = [
-    "BuildReport",
-    "DocumentTree",
-    "HeadingInfo",
-    "LLMSummarizerStub",
-    "MockSummarizer",
-    "OpenAICompatibleSummarizer",
-    "Section",
-    "Summarizer",
-    "TreeNode",
-    "build_document",
-    "build_document_tree",
-    "build_llm_summarizer_from_env",
-    "build_robust_tree",
-    "document_tree_to_dict",
-    "export_document_tree_json",
-    "generate_preamble_summaries",
-    "generate_summaries",
-    "inject_preamble_leaves",
-    "parse_heading_line",
-    "parse_markdown_file",
-    "parse_markdown_sections",
-    "postorder_nodes",
-    "print_document_tree",
-    "traverse_all_nodes",
-    "validate_and_fix_tree",
-]
+"""Tree Builder package.
+
+Re-exports resolve lazily (PEP 562): importing the package no longer pulls
+the builder -> llm_corrector -> HTTP client chain for callers that only
+need the parser or tree model.
+"""
+
+from importlib import import_module
+
+_LAZY_EXPORTS = {
+    "BuildReport": "tree_builder.builder",
+    "build_document": "tree_builder.builder",
+    "build_robust_tree": "tree_builder.builder",
+    "HeadingInfo": "tree_builder.parser",
+    "Section": "tree_builder.parser",
+    "parse_heading_line": "tree_builder.parser",
+    "parse_markdown_file": "tree_builder.parser",
+    "parse_markdown_sections": "tree_builder.parser",
+    "generate_preamble_summaries": "tree_builder.preamble",
+    "inject_preamble_leaves": "tree_builder.preamble",
+    "LLMSummarizerStub": "tree_builder.summary",
+    "MockSummarizer": "tree_builder.summary",
+    "OpenAICompatibleSummarizer": "tree_builder.summary",
+    "Summarizer": "tree_builder.summary",
+    "build_llm_summarizer_from_env": "tree_builder.summary",
+    "generate_summaries": "tree_builder.summary",
+    "DocumentTree": "tree_builder.tree",
+    "TreeNode": "tree_builder.tree",
+    "build_document_tree": "tree_builder.tree",
+    "postorder_nodes": "tree_builder.tree",
+    "traverse_all_nodes": "tree_builder.tree",
+    "validate_and_fix_tree": "tree_builder.tree",
+    "document_tree_to_dict": "tree_builder.visualizer",
+    "export_document_tree_json": "tree_builder.visualizer",
+    "print_document_tree": "tree_builder.visualizer",
+}
+
+__all__ = sorted(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
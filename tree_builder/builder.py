@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 import os
 from typing import Any
 
@@ -12,15 +12,13 @@ from tree_builder.llm_corrector import (
     llm_infer_partial,
     merge_llm_corrections,
 )
-from tree_builder.parser import HeadingInfo, Section
+from tree_builder.parser import build_sections, line_offsets
 from tree_builder.preamble import generate_preamble_summaries, inject_preamble_leaves
 from tree_builder.preprocessor import RawHeading, extract_raw_headings
 from tree_builder.rule_engine import (
     LLM_CONFIDENCE_THRESHOLD,
-    confidence_stats,
+    LevelInference,
     infer_levels,
-    needs_llm_correction,
-    select_llm_mode,
 )
 from tree_builder.signals import extract_all_signals
 from tree_builder.summary import Summarizer, generate_summaries
@@ -30,7 +28,7 @@ from tree_builder.tree import DocumentTree, build_document_tree, validate_and_fi
 MAX_DEPTH = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildReport:
     warnings: list[str] = field(default_factory=list)
     fixes: list[str] = field(default_factory=list)
@@ -41,45 +39,76 @@ class BuildReport:
     preamble_injected: int = 0
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        # Shallow on purpose: asdict() deep-copies every nested row, which is
+        # pure overhead for read-only consumers like report printing.
+        return {
+            "warnings": self.warnings,
+            "fixes": self.fixes,
+            "llm_used": self.llm_used,
+            "llm_mode": self.llm_mode,
+            "confidence_stats": self.confidence_stats,
+            "low_confidence_headings": self.low_confidence_headings,
+            "preamble_injected": self.preamble_injected,
+        }
 
 
-def _extract_root_preamble(lines: list[str], raw_headings: list[RawHeading]) -> str:
+def _extract_root_preamble(text: str, offsets: list[int], raw_headings: list[RawHeading]) -> str:
     if not raw_headings:
-        return "\n".join(lines).strip()
+        return text.strip()
     first_line = raw_headings[0].line_index
-    return "\n".join(lines[:first_line]).strip()
+    return text[: offsets[first_line]].strip()
 
 
-def _build_sections(
-    lines: list[str],
+def _summarize_rule_results(
+    rule_results: list[LevelInference],
     raw_headings: list[RawHeading],
-    inferences,
-) -> list[Section]:
-    if not raw_headings:
-        return []
-
-    sections: list[Section] = []
-    for index, heading in enumerate(raw_headings):
-        start = heading.line_index + 1
-        end = raw_headings[index + 1].line_index if index + 1 < len(raw_headings) else len(lines)
-        content = "\n".join(lines[start:end]).strip()
-        inference = inferences[index]
-        section_heading = HeadingInfo(
-            hash_count=heading.hash_count,
-            numbering=inference.signals.numbering,
-            clean_title=inference.signals.heading_text,
-            inferred_level=inference.inferred_level,
-            heading_raw=heading.raw_text,
-        )
-        sections.append(
-            Section(
-                heading=section_heading,
-                content=content,
-                index=index + 1,
+    threshold: float = LLM_CONFIDENCE_THRESHOLD,
+) -> tuple[dict[str, int], bool, str, list[dict[str, Any]]]:
+    """Fused single pass over rule results.
+
+    Produces the confidence stats, the needs-LLM decision, the LLM mode, and
+    the low-confidence rows that build_robust_tree previously collected in
+    four separate walks (confidence_stats, needs_llm_correction,
+    select_llm_mode, plus the report comprehension).
+    """
+    high = medium = low = 0
+    low_confidence: list[dict[str, Any]] = []
+    first_hash = rule_results[0].signals.hash_count
+    all_same_hash = True
+    any_numbering = False
+    level_jump = False
+    previous_level: int | None = None
+
+    for result in rule_results:
+        if result.confidence >= 0.8:
+            high += 1
+        elif result.confidence >= threshold:
+            medium += 1
+        else:
+            low += 1
+            low_confidence.append(
+                {
+                    "index": result.signals.index,
+                    "heading": raw_headings[result.signals.index].raw_text,
+                    "level": result.inferred_level,
+                    "confidence": round(result.confidence, 3),
+                    "reason": result.reason,
+                }
             )
-        )
-    return sections
+        if result.signals.hash_count != first_hash:
+            all_same_hash = False
+        if result.signals.numbering_depth > 0:
+            any_numbering = True
+        if previous_level is not None and result.inferred_level - previous_level > 1:
+            level_jump = True
+        previous_level = result.inferred_level
+
+    total = len(rule_results)
+    low_ratio = low / total
+    needs_llm = low_ratio > 0.3 or (all_same_hash and not any_numbering) or level_jump
+    mode = "full" if low_ratio > 0.5 else "partial"
+    stats = {"high": high, "medium": medium, "low": low, "total": total}
+    return stats, needs_llm, mode, low_confidence
 
 
 def build_robust_tree(
@@ -102,23 +131,13 @@ def build_robust_tree(
 
     signals_list = extract_all_signals(raw_headings)
     rule_results = infer_levels(signals_list, max_depth=max_depth)
-    report.confidence_stats = confidence_stats(rule_results)
-    report.low_confidence_headings = [
-        {
-            "index": result.signals.index,
-            "heading": raw_headings[result.signals.index].raw_text,
-            "level": result.inferred_level,
-            "confidence": round(result.confidence, 3),
-            "reason": result.reason,
-        }
-        for result in rule_results
-        if result.confidence < LLM_CONFIDENCE_THRESHOLD
-    ]
+    stats, needs_llm, mode, low_confidence = _summarize_rule_results(rule_results, raw_headings)
+    report.confidence_stats = stats
+    report.low_confidence_headings = low_confidence
 
     final_results = rule_results
-    should_use_llm = llm_client is not None and needs_llm_correction(rule_results)
+    should_use_llm = llm_client is not None and needs_llm
     if should_use_llm:
-        mode = select_llm_mode(rule_results)
         model = llm_model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
         report.llm_used = True
         report.llm_mode = mode
@@ -146,13 +165,17 @@ def build_robust_tree(
             llm_results=llm_levels,
             threshold=LLM_CONFIDENCE_THRESHOLD,
         )
-    elif llm_client is None and needs_llm_correction(rule_results):
+    elif llm_client is None and needs_llm:
         report.warnings.append(
             "Low-confidence headings detected but LLM correction is disabled."
         )
 
-    root_content = _extract_root_preamble(lines, raw_headings)
-    sections = _build_sections(lines, raw_headings, final_results)
+    # Section bodies are sliced straight out of one normalized string instead
+    # of re-joining a list slice per section.
+    text = "\n".join(lines)
+    offsets = line_offsets(lines)
+    root_content = _extract_root_preamble(text, offsets, raw_headings)
+    sections = build_sections(text, offsets, raw_headings, inferences=final_results)
     tree = build_document_tree(doc_id=doc_id, sections=sections, root_content=root_content)
 
     report.fixes = validate_and_fix_tree(tree.root, max_depth=max_depth)
@@ -178,10 +201,10 @@ def build_document(
     )
 
     generate_summaries(tree, summarizer)
-    injected_count = inject_preamble_leaves(tree.root)
-    report.preamble_injected = injected_count
-    if injected_count:
-        generate_preamble_summaries(tree.root, summarizer)
+    injected = inject_preamble_leaves(tree.root)
+    report.preamble_injected = len(injected)
+    if injected:
+        generate_preamble_summaries(tree.root, summarizer, nodes=injected)
 
     tree.recompute_counts()
     return tree, report
@@ -6,29 +6,52 @@ import os
 from pathlib import Path
 
 
+_QUOTES = ('"', "'")
+
+
 def _strip_quotes(value: str) -> str:
-    if len(value) >= 2 and value[0] == value[-1] and value[0] in {'"', "'"}:
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in _QUOTES:
         return value[1:-1]
     return value
 
 
-def _load_env_fallback(env_path: Path, override: bool) -> bool:
-    if not env_path.exists():
-        return False
+# Parsed .env contents keyed by path, invalidated on mtime change, so batch
+# runs that call load_env() per document parse the file once.
+_ENV_CACHE: dict[Path, tuple[float, list[tuple[str, str]]]] = {}
 
-    loaded = False
+
+def _parse_env_file(env_path: Path) -> list[tuple[str, str]]:
+    pairs: list[tuple[str, str]] = []
     for line in env_path.read_text(encoding="utf-8").splitlines():
         stripped = line.strip()
         if not stripped or stripped.startswith("#"):
             continue
-        if "=" not in stripped:
+        eq = stripped.find("=")
+        if eq == -1:
             continue
 
-        key, value = stripped.split("=", 1)
-        key = key.strip()
-        value = _strip_quotes(value.strip())
+        key = stripped[:eq].strip()
         if not key:
             continue
+        pairs.append((key, _strip_quotes(stripped[eq + 1 :].strip())))
+    return pairs
+
+
+def _load_env_fallback(env_path: Path, override: bool) -> bool:
+    try:
+        mtime = env_path.stat().st_mtime
+    except OSError:
+        return False
+
+    cached = _ENV_CACHE.get(env_path)
+    if cached is None or cached[0] != mtime:
+        pairs = _parse_env_file(env_path)
+        _ENV_CACHE[env_path] = (mtime, pairs)
+    else:
+        pairs = cached[1]
+
+    loaded = False
+    for key, value in pairs:
         if not override and key in os.environ:
             continue
         os.environ[key] = value
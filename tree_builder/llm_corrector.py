@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 import json
 import os
+import sys
 from typing import Protocol
 
 from tree_builder.preprocessor import RawHeading
 from tree_builder.rule_engine import LLM_CONFIDENCE_THRESHOLD, LevelInference
 from tree_rag.utils.openai_client import OpenAICompatibleClient
 
+try:
+    from orjson import loads as _json_loads  # type: ignore
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
 
 @dataclass(slots=True)
 class LLMLevelSuggestion:
@@ -31,6 +39,11 @@ class TreeStructureLLMClient(Protocol):
         """Return raw text from a chat completion endpoint."""
 
 
+# Clients keyed by connection parameters so batch runs share one instance
+# across documents instead of constructing a client per build.
+_CLIENT_CACHE: dict[tuple[str, str, float], OpenAICompatibleClient] = {}
+
+
 def build_openai_tree_llm_client_from_env() -> tuple[OpenAICompatibleClient, str]:
     api_key = os.getenv("OPENAI_API_KEY", "").strip()
     if not api_key:
@@ -40,18 +53,22 @@ def build_openai_tree_llm_client_from_env() -> tuple[OpenAICompatibleClient, str
     model = os.getenv("OPENAI_MODEL", "gpt-4o-mini").strip()
     timeout_seconds = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "30"))
 
-    client = OpenAICompatibleClient(
-        api_key=api_key,
-        base_url=base_url,
-        timeout_seconds=timeout_seconds,
-    )
+    cache_key = (base_url, api_key, timeout_seconds)
+    client = _CLIENT_CACHE.get(cache_key)
+    if client is None:
+        client = OpenAICompatibleClient(
+            api_key=api_key,
+            base_url=base_url,
+            timeout_seconds=timeout_seconds,
+        )
+        _CLIENT_CACHE[cache_key] = client
     return client, model
 
 
 def _parse_llm_suggestions(text: str, max_depth: int = 3) -> dict[int, LLMLevelSuggestion]:
     try:
-        payload = json.loads(text)
-    except json.JSONDecodeError as exc:
+        payload = _json_loads(text)
+    except ValueError as exc:
         raise RuntimeError("LLM correction response is not valid JSON.") from exc
 
     if isinstance(payload, dict):
@@ -88,14 +105,18 @@ def _parse_llm_suggestions(text: str, max_depth: int = 3) -> dict[int, LLMLevelS
 def _build_full_mode_prompt(
     raw_headings: list[RawHeading],
     rule_results: list[LevelInference],
+    index_offset: int = 0,
 ) -> str:
-    heading_lines = "\n".join(
-        f"{index}. {heading.raw_text}" for index, heading in enumerate(raw_headings)
-    )
-    rule_lines = "\n".join(
-        f"index={result.signals.index}, level={result.inferred_level}, confidence={result.confidence:.2f}, reason={result.reason}"
-        for result in rule_results
-    )
+    heading_rows: list[str] = []
+    rule_rows: list[str] = []
+    for index, (heading, result) in enumerate(zip(raw_headings, rule_results), start=index_offset):
+        heading_rows.append(f"{index}. {heading.raw_text}")
+        rule_rows.append(
+            f"index={result.signals.index}, level={result.inferred_level}, "
+            f"confidence={result.confidence:.2f}, reason={result.reason}"
+        )
+    heading_lines = "\n".join(heading_rows)
+    rule_lines = "\n".join(rule_rows)
 
     return (
         "You are a document structure analysis expert. Infer the heading level for each heading.\n"
@@ -112,17 +133,18 @@ def _build_partial_mode_prompt(
     rule_results: list[LevelInference],
     threshold: float,
 ) -> str:
-    context_lines = []
+    context_lines: list[str] = []
+    uncertain_rows: list[str] = []
     for result in rule_results:
-        marker = "[?]" if result.confidence < threshold else f"[L{result.inferred_level}]"
-        context_lines.append(f"{marker} {result.signals.index}. {raw_headings[result.signals.index].raw_text}")
-
-    uncertain_lines = "\n".join(
-        f"index={result.signals.index}, heading={raw_headings[result.signals.index].raw_text}"
-        for result in rule_results
-        if result.confidence < threshold
-    )
-
+        index = result.signals.index
+        raw_text = raw_headings[index].raw_text
+        if result.confidence < threshold:
+            context_lines.append(f"[?] {index}. {raw_text}")
+            uncertain_rows.append(f"index={index}, heading={raw_text}")
+        else:
+            context_lines.append(f"[L{result.inferred_level}] {index}. {raw_text}")
+
+    uncertain_lines = "\n".join(uncertain_rows)
     context_str = "\n".join(context_lines)
     return (
         "You are a document structure analysis expert.\n"
@@ -134,14 +156,21 @@ def _build_partial_mode_prompt(
     )
 
 
-def llm_infer_full_structure(
+# Above this many headings, full-mode inference splits the document into
+# per-batch prompts issued concurrently: wall time becomes the slowest batch
+# instead of one giant serial request.
+FULL_MODE_BATCH_SIZE = 50
+
+
+def _infer_full_batch(
     raw_headings: list[RawHeading],
     rule_results: list[LevelInference],
     llm_client: TreeStructureLLMClient,
     model: str,
-    max_depth: int = 3,
+    max_depth: int,
+    index_offset: int,
 ) -> dict[int, LLMLevelSuggestion]:
-    prompt = _build_full_mode_prompt(raw_headings, rule_results)
+    prompt = _build_full_mode_prompt(raw_headings, rule_results, index_offset=index_offset)
     response = llm_client.chat_completion(
         model=model,
         messages=[{"role": "user", "content": prompt}],
@@ -152,6 +181,38 @@ def llm_infer_full_structure(
     return _parse_llm_suggestions(response, max_depth=max_depth)
 
 
+def llm_infer_full_structure(
+    raw_headings: list[RawHeading],
+    rule_results: list[LevelInference],
+    llm_client: TreeStructureLLMClient,
+    model: str,
+    max_depth: int = 3,
+) -> dict[int, LLMLevelSuggestion]:
+    if len(raw_headings) <= FULL_MODE_BATCH_SIZE:
+        return _infer_full_batch(
+            raw_headings, rule_results, llm_client, model, max_depth, index_offset=0
+        )
+
+    starts = range(0, len(raw_headings), FULL_MODE_BATCH_SIZE)
+    with ThreadPoolExecutor(max_workers=min(4, len(starts))) as executor:
+        futures = [
+            executor.submit(
+                _infer_full_batch,
+                raw_headings[start : start + FULL_MODE_BATCH_SIZE],
+                rule_results[start : start + FULL_MODE_BATCH_SIZE],
+                llm_client,
+                model,
+                max_depth,
+                start,
+            )
+            for start in starts
+        ]
+        suggestions: dict[int, LLMLevelSuggestion] = {}
+        for future in futures:
+            suggestions.update(future.result())
+    return suggestions
+
+
 def llm_infer_partial(
     raw_headings: list[RawHeading],
     rule_results: list[LevelInference],
@@ -171,6 +232,18 @@ def llm_infer_partial(
     return _parse_llm_suggestions(response, max_depth=max_depth)
 
 
+# Fixed literals are interned so every corrected inference shares one string
+# object; models often return boilerplate reasonings, so the formatted reason
+# is cached too instead of being rebuilt per heading.
+_LLM_SOURCE = sys.intern("llm")
+_LLM_CORRECTED = sys.intern("llm:corrected")
+
+
+@lru_cache(maxsize=256)
+def _format_reason(reasoning: str) -> str:
+    return f"llm:{reasoning}"
+
+
 def merge_llm_corrections(
     rule_results: list[LevelInference],
     llm_results: dict[int, LLMLevelSuggestion],
@@ -199,8 +272,8 @@ def merge_llm_corrections(
                 signals=result.signals,
                 inferred_level=suggestion.level,
                 confidence=0.85,
-                reason=f"llm:{suggestion.reasoning}" if suggestion.reasoning else "llm:corrected",
-                source="llm",
+                reason=_format_reason(suggestion.reasoning) if suggestion.reasoning else _LLM_CORRECTED,
+                source=_LLM_SOURCE,
             )
         )
 
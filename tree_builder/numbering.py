@@ -3,18 +3,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import re
 
 
-ARABIC_RE = re.compile(r"^(\d+(?:\.\d+)*)(?:[\.\)\:\-]|\s)+(.+)$")
-LETTER_RE = re.compile(r"^([A-Z](?:\.\d+)*)(?:[\.\)\:\-]|\s)+(.+)$")
-ROMAN_RE = re.compile(
-    r"^((?:M{0,4})(?:CM|CD|D?C{0,3})(?:XC|XL|L?X{0,3})(?:IX|IV|V?I{1,3}))(?:[\.\)\:\-]|\s)+(.+)$",
-    re.IGNORECASE,
+# One alternation replaces six serial match attempts per heading; branch order
+# encodes match priority (appendix > prefix > arabic > roman > letter >
+# chinese) and (?i:...) scopes case-insensitivity to the branches that had it.
+NUMBERING_RE = re.compile(
+    r"^(?:"
+    r"(?i:Appendix\s+(?P<appendix>[A-Z](?:\.\d+)*)\s*(?:[\.:\-]\s*)?(?P<appendix_title>.+)?)"
+    r"|(?i:(?:Chapter|Part|Section)\s+(?P<prefix>[A-Za-z0-9.]+)\s*(?:[\.:\-]\s*)?(?P<prefix_title>.+))"
+    r"|(?P<arabic>\d+(?:\.\d+)*)(?:[\.\)\:\-]|\s)+(?P<arabic_title>.+)"
+    r"|(?i:(?P<roman>(?:M{0,4})(?:CM|CD|D?C{0,3})(?:XC|XL|L?X{0,3})(?:IX|IV|V?I{1,3}))(?:[\.\)\:\-]|\s)+(?P<roman_title>.+))"
+    r"|(?P<letter>[A-Z](?:\.\d+)*)(?:[\.\)\:\-]|\s)+(?P<letter_title>.+)"
+    r"|第(?P<chinese>[一二三四五六七八九十百]+)(?P<chinese_unit>[章节部分篇])\s*(?P<chinese_title>.*)"
+    r")$"
 )
-CHINESE_RE = re.compile(r"^第([一二三四五六七八九十百]+)([章节部分篇])\s*(.*)$")
-PREFIX_RE = re.compile(r"^(Chapter|Part|Section)\s+([A-Za-z0-9.]+)\s*(?:[\.:\-]\s*)?(.+)$", re.IGNORECASE)
-APPENDIX_RE = re.compile(r"^Appendix\s+([A-Z](?:\.\d+)*)\s*(?:[\.:\-]\s*)?(.+)?$", re.IGNORECASE)
 
 
 @dataclass(slots=True)
@@ -36,46 +41,50 @@ def _depth_from_numbering(numbering: str, numbering_type: str) -> int:
     return 0
 
 
+# Duplicate headings are common (table-of-contents echoes, preamble
+# injection); callers treat the parse result as read-only, so cached
+# instances are safe to share.
+@lru_cache(maxsize=4096)
 def parse_numbering(text: str) -> NumberingParse:
     stripped = text.strip()
     if not stripped:
         return NumberingParse(None, None, 0, "")
 
-    appendix_match = APPENDIX_RE.match(stripped)
-    if appendix_match is not None:
-        numbering = appendix_match.group(1).strip()
-        title = (appendix_match.group(2) or "").strip() or stripped
+    # Every branch starts with an ASCII letter, a digit, or 第; anything else
+    # (bullets, CJK prose, punctuation) cannot match, so skip the regex.
+    first = stripped[0]
+    if not ("0" <= first <= "9" or "A" <= first <= "Z" or "a" <= first <= "z" or first == "第"):
+        return NumberingParse(None, None, 0, stripped)
+
+    match = NUMBERING_RE.match(stripped)
+    if match is None:
+        return NumberingParse(None, None, 0, stripped)
+
+    if match["appendix"] is not None:
+        numbering = match["appendix"].strip()
+        title = (match["appendix_title"] or "").strip() or stripped
         return NumberingParse(numbering, "appendix", _depth_from_numbering(numbering, "appendix"), title)
 
-    prefix_match = PREFIX_RE.match(stripped)
-    if prefix_match is not None:
-        numbering = prefix_match.group(2).strip()
-        title = prefix_match.group(3).strip() if prefix_match.group(3) else stripped
+    if match["prefix"] is not None:
+        numbering = match["prefix"].strip()
+        title = match["prefix_title"].strip() or stripped
         return NumberingParse(numbering, "prefix", _depth_from_numbering(numbering, "prefix"), title)
 
-    arabic_match = ARABIC_RE.match(stripped)
-    if arabic_match is not None:
-        numbering = arabic_match.group(1).strip()
-        title = arabic_match.group(2).strip()
+    if match["arabic"] is not None:
+        numbering = match["arabic"].strip()
+        title = match["arabic_title"].strip()
         return NumberingParse(numbering, "arabic", _depth_from_numbering(numbering, "arabic"), title)
 
-    roman_match = ROMAN_RE.match(stripped)
-    if roman_match is not None:
-        numbering = roman_match.group(1).strip()
-        title = roman_match.group(2).strip()
+    if match["roman"] is not None:
+        numbering = match["roman"].strip()
+        title = match["roman_title"].strip()
         return NumberingParse(numbering, "roman", _depth_from_numbering(numbering, "roman"), title)
 
-    letter_match = LETTER_RE.match(stripped)
-    if letter_match is not None:
-        numbering = letter_match.group(1).strip()
-        title = letter_match.group(2).strip()
+    if match["letter"] is not None:
+        numbering = match["letter"].strip()
+        title = match["letter_title"].strip()
         return NumberingParse(numbering, "letter", _depth_from_numbering(numbering, "letter"), title)
 
-    chinese_match = CHINESE_RE.match(stripped)
-    if chinese_match is not None:
-        numbering = f"第{chinese_match.group(1)}{chinese_match.group(2)}"
-        trailing = chinese_match.group(3).strip()
-        title = trailing if trailing else stripped
-        return NumberingParse(numbering, "chinese", _depth_from_numbering(numbering, "chinese"), title)
-
-    return NumberingParse(None, None, 0, stripped)
+    numbering = f"第{match['chinese']}{match['chinese_unit']}"
+    title = match["chinese_title"].strip() or stripped
+    return NumberingParse(numbering, "chinese", _depth_from_numbering(numbering, "chinese"), title)
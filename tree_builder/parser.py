@@ -10,7 +10,7 @@ from tree_builder.rule_engine import DocumentContext, infer_level, infer_levels
 from tree_builder.signals import extract_all_signals, extract_heading_signals
 
 
-@dataclass
+@dataclass(slots=True)
 class HeadingInfo:
     hash_count: int
     numbering: str | None
@@ -19,7 +19,7 @@ class HeadingInfo:
     heading_raw: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     heading: HeadingInfo
     content: str
@@ -51,21 +51,39 @@ def parse_heading_line(line: str) -> HeadingInfo | None:
     )
 
 
-def _build_sections(
-    lines: list[str],
+def line_offsets(lines: list[str]) -> list[int]:
+    """Start offset of each line in the newline-joined text, plus an end sentinel."""
+    offsets = [0]
+    position = 0
+    for line in lines:
+        position += len(line) + 1
+        offsets.append(position)
+    return offsets
+
+
+def build_sections(
+    text: str,
+    offsets: list[int],
     raw_headings: list[RawHeading],
+    inferences: list | None = None,
 ) -> list[Section]:
+    """Assemble sections from extracted headings and precomputed line offsets.
+
+    ``inferences`` may be supplied by callers that already ran level
+    inference (the robust builder does); otherwise it is computed here.
+    """
     if not raw_headings:
         return []
 
-    signals = extract_all_signals(raw_headings)
-    inferences = infer_levels(signals)
+    if inferences is None:
+        inferences = infer_levels(extract_all_signals(raw_headings))
+    line_count = len(offsets) - 1
     sections: list[Section] = []
 
     for index, heading in enumerate(raw_headings):
         start = heading.line_index + 1
-        end = raw_headings[index + 1].line_index if index + 1 < len(raw_headings) else len(lines)
-        content = "\n".join(lines[start:end]).strip()
+        end = raw_headings[index + 1].line_index if index + 1 < len(raw_headings) else line_count
+        content = text[offsets[start] : offsets[end]].strip()
         inference = inferences[index]
         sections.append(
             Section(
@@ -88,17 +106,19 @@ def parse_markdown_sections(text: str) -> list[Section]:
     """Parse markdown text into sections keyed by inferred heading levels."""
     lines = text.splitlines()
     raw_headings, _ = extract_raw_headings(lines)
-    return _build_sections(lines, raw_headings)
+    return build_sections("\n".join(lines), line_offsets(lines), raw_headings)
 
 
 def parse_markdown_with_preamble(text: str) -> tuple[list[Section], str]:
     """Parse sections and return text before first heading as preamble."""
     lines = text.splitlines()
     raw_headings, _ = extract_raw_headings(lines)
-    sections = _build_sections(lines, raw_headings)
+    joined = "\n".join(lines)
     if not raw_headings:
-        return sections, text.strip()
-    preamble = "\n".join(lines[: raw_headings[0].line_index]).strip()
+        return [], joined.strip()
+    offsets = line_offsets(lines)
+    sections = build_sections(joined, offsets, raw_headings)
+    preamble = joined[: offsets[raw_headings[0].line_index]].strip()
     return sections, preamble
 
 
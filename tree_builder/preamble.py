@@ -1,4 +1,4 @@
-﻿"""Preamble leaf injection for non-leaf nodes with direct content."""
+"""Preamble leaf injection for non-leaf nodes with direct content."""
 
 from __future__ import annotations
 
@@ -6,9 +6,13 @@ from tree_builder.summary import Summarizer
 from tree_builder.tree import TreeNode, postorder_nodes
 
 
-def inject_preamble_leaves(root: TreeNode) -> int:
-    """Inject one preamble leaf for each non-leaf node that has direct content."""
-    injected = 0
+def inject_preamble_leaves(root: TreeNode) -> list[TreeNode]:
+    """Inject one preamble leaf for each non-leaf node that has direct content.
+
+    Returns the injected nodes so callers can process exactly those instead of
+    rescanning the whole tree for ``_preamble`` suffixes.
+    """
+    injected: list[TreeNode] = []
 
     for node in postorder_nodes(root):
         if node.level == 0:
@@ -31,17 +35,34 @@ def inject_preamble_leaves(root: TreeNode) -> int:
 
         node.children.insert(0, preamble)
         node.content = ""
-        injected += 1
+        injected.append(preamble)
 
     return injected
 
 
-def generate_preamble_summaries(root: TreeNode, summarizer: Summarizer) -> int:
-    """Generate summary for injected preamble leaves."""
-    summarized = 0
-    for node in postorder_nodes(root):
-        if not node.node_id.endswith("_preamble"):
-            continue
+def generate_preamble_summaries(
+    root: TreeNode,
+    summarizer: Summarizer,
+    nodes: list[TreeNode] | None = None,
+) -> int:
+    """Generate summary for injected preamble leaves.
+
+    When ``nodes`` (as returned by :func:`inject_preamble_leaves`) is given,
+    only those leaves are summarized; otherwise the tree is scanned for them.
+    """
+    if nodes is None:
+        nodes = [
+            node for node in postorder_nodes(root) if node.node_id.endswith("_preamble")
+        ]
+
+    # Preamble leaves are independent of each other, so summarizers exposing a
+    # batch entry point (e.g. LLM-backed ones) get all of them at once.
+    batch = getattr(summarizer, "summarize_leaves_batch", None)
+    if batch is not None and len(nodes) > 1:
+        for node, summary in zip(nodes, batch([(node.heading, node.content) for node in nodes])):
+            node.summary = summary
+        return len(nodes)
+
+    for node in nodes:
         node.summary = summarizer.summarize_leaf(node.heading, node.content)
-        summarized += 1
-    return summarized
+    return len(nodes)
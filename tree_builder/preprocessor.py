@@ -6,13 +6,18 @@ from dataclasses import dataclass
 import re
 
 
-ATX_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*$")
-ATX_HEADING_LOOSE_RE = re.compile(r"^(#{1,6})(\S.*?)\s*$")
+# re.ASCII keeps \s on the fast ASCII classes for the heading/fence matchers,
+# where a miss only routes the line through the loose-match fallback.
+# TRAILING_HASH_RE and MULTI_SPACE_RE must stay Unicode: closing hashes may be
+# preceded by a full-width space (`## 标题　##`), and MULTI_SPACE_RE is what
+# normalizes full-width spaces inside headings.
+ATX_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*$", re.ASCII)
+ATX_HEADING_LOOSE_RE = re.compile(r"^(#{1,6})(\S.*?)\s*$", re.ASCII)
 TRAILING_HASH_RE = re.compile(r"\s+#+\s*$")
 MARKDOWN_LINK_RE = re.compile(r"\[([^\]]+)\]\([^\)]+\)")
 BOLD_ITALIC_RE = re.compile(r"(\*\*|__|\*|_)(.+?)\1")
 MULTI_SPACE_RE = re.compile(r"\s+")
-FENCE_RE = re.compile(r"^\s*(`{3,}|~{3,})")
+FENCE_RE = re.compile(r"^\s*(`{3,}|~{3,})", re.ASCII)
 ENDING_PUNCTUATION_RE = re.compile(r"[\.!\?;:。！？；：]$")
 NUMBERING_HINT_RE = re.compile(
     r"^(\d+(?:\.\d+)*|[A-Z](?:\.\d+)*|[IVXLCDM]+|第[一二三四五六七八九十百]+[章节部分篇])(?:[\.\s\):\-]+|\s+).+",
@@ -50,15 +55,20 @@ def mark_code_blocks(lines: list[str]) -> set[int]:
 
 
 def _strip_markdown_formatting(text: str) -> str:
+    # Each substitution is gated on a character its pattern requires, so the
+    # common formatting-free heading skips the regex passes entirely.
     cleaned = text
-    cleaned = TRAILING_HASH_RE.sub("", cleaned)
-    cleaned = MARKDOWN_LINK_RE.sub(r"\1", cleaned)
-    # Apply emphasis replacement iteratively for nested formatting.
-    for _ in range(3):
-        updated = BOLD_ITALIC_RE.sub(r"\2", cleaned)
-        if updated == cleaned:
-            break
-        cleaned = updated
+    if "#" in cleaned:
+        cleaned = TRAILING_HASH_RE.sub("", cleaned)
+    if "[" in cleaned:
+        cleaned = MARKDOWN_LINK_RE.sub(r"\1", cleaned)
+    if "*" in cleaned or "_" in cleaned:
+        # Apply emphasis replacement iteratively for nested formatting.
+        for _ in range(3):
+            updated = BOLD_ITALIC_RE.sub(r"\2", cleaned)
+            if updated == cleaned:
+                break
+            cleaned = updated
     cleaned = cleaned.strip().strip("\u3000")
     cleaned = cleaned.rstrip("。.；;:")
     cleaned = MULTI_SPACE_RE.sub(" ", cleaned)
@@ -67,7 +77,7 @@ def _strip_markdown_formatting(text: str) -> str:
 
 def normalize_heading(raw_line: str) -> dict[str, int | str | bool] | None:
     """Normalize one heading line and return parsed fields."""
-    normalized_line = raw_line.lstrip("\ufeff")
+    normalized_line = raw_line.lstrip("\ufeff") if raw_line.startswith("\ufeff") else raw_line
     match = ATX_HEADING_RE.match(normalized_line)
     if match is None:
         match = ATX_HEADING_LOOSE_RE.match(normalized_line)
@@ -112,14 +122,27 @@ def detect_unmarked_heading(line: str, prev_line: str, next_line: str) -> bool:
 
 def extract_raw_headings(lines: list[str]) -> tuple[list[RawHeading], set[int]]:
     """Extract ordered headings from markdown lines, skipping code blocks."""
-    code_block_lines = mark_code_blocks(lines)
+    # Fence tracking is folded into the heading walk, so each line is visited
+    # once instead of getting a dedicated code-block pass first.
     raw_headings: list[RawHeading] = []
+    code_block_lines: set[int] = set()
+    in_code = False
 
     for index, line in enumerate(lines):
-        if index in code_block_lines:
+        if FENCE_RE.match(line):
+            code_block_lines.add(index)
+            in_code = not in_code
+            continue
+        if in_code:
+            code_block_lines.add(index)
             continue
 
-        normalized = normalize_heading(line)
+        # Only lines starting with '#' (optionally BOM-prefixed) can match the
+        # ATX regexes; skip the regex machinery entirely for everything else.
+        if line.startswith(("#", "\ufeff")):
+            normalized = normalize_heading(line)
+        else:
+            normalized = None
         if normalized is not None:
             raw_headings.append(
                 RawHeading(
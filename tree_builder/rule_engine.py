@@ -25,28 +25,37 @@ class DocumentContext:
 
     def __init__(self, all_headings: list[HeadingSignals]) -> None:
         self.all_headings = all_headings
-        self.hash_distribution = Counter(
-            heading.hash_count for heading in all_headings if heading.has_hash_marker
-        )
-        self.has_any_numbering = any(heading.numbering_depth > 0 for heading in all_headings)
-        self.numbering_coverage = (
-            sum(1 for heading in all_headings if heading.numbering_depth > 0) / len(all_headings)
-            if all_headings
-            else 0.0
+        hash_distribution: Counter[int] = Counter()
+        numbering_types: Counter[str] = Counter()
+        numbered_count = 0
+        for heading in all_headings:
+            if heading.has_hash_marker:
+                hash_distribution[heading.hash_count] += 1
+            if heading.numbering_depth > 0:
+                numbered_count += 1
+            if heading.numbering_type:
+                numbering_types[heading.numbering_type] += 1
+
+        self.hash_distribution = hash_distribution
+        self.has_any_numbering = numbered_count > 0
+        self.numbering_coverage = numbered_count / len(all_headings) if all_headings else 0.0
+        # Derived answers are fixed once the headings are known; cache them so
+        # infer_level's per-heading queries are attribute reads.
+        if not hash_distribution:
+            self._hash_consistency = "inconsistent"
+        elif len(hash_distribution) == 1:
+            self._hash_consistency = "all_same"
+        else:
+            self._hash_consistency = "consistent"
+        self._dominant_numbering_type = (
+            numbering_types.most_common(1)[0][0] if numbering_types else None
         )
 
     def check_hash_consistency(self) -> str:
-        if not self.hash_distribution:
-            return "inconsistent"
-        if len(self.hash_distribution) == 1:
-            return "all_same"
-        return "consistent"
+        return self._hash_consistency
 
     def get_dominant_numbering_type(self) -> str | None:
-        types = [heading.numbering_type for heading in self.all_headings if heading.numbering_type]
-        if not types:
-            return None
-        return Counter(types).most_common(1)[0][0]
+        return self._dominant_numbering_type
 
 
 def infer_level(signals: HeadingSignals, context: DocumentContext, max_depth: int = 3) -> tuple[int, float, str]:
@@ -49,4 +49,29 @@ def extract_heading_signals(index: int, raw_heading: RawHeading) -> HeadingSigna
 
 
 def extract_all_signals(raw_headings: list[RawHeading]) -> list[HeadingSignals]:
-    return [extract_heading_signals(index, heading) for index, heading in enumerate(raw_headings)]
+    # Inlined hot loop: binding the callees and constructor to locals and
+    # passing positional fields skips one Python frame plus keyword-argument
+    # handling per heading compared with calling extract_heading_signals.
+    _parse = parse_numbering
+    _special = match_special_section
+    _signals = HeadingSignals
+    out: list[HeadingSignals] = [None] * len(raw_headings)  # type: ignore[list-item]
+    for index, heading in enumerate(raw_headings):
+        numbering = _parse(heading.raw_text)
+        title = numbering.title_without_numbering
+        special_level = _special(title)
+        out[index] = _signals(
+            index,
+            heading.line_index,
+            heading.raw_text,
+            heading.hash_count,
+            heading.has_hash_marker,
+            numbering.numbering,
+            numbering.numbering_type,
+            numbering.numbering_depth,
+            special_level is not None,
+            special_level or 1,
+            len(title),
+            title,
+        )
+    return out
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 SPECIAL_SECTIONS: dict[str, int] = {
     "abstract": 1,
     "摘要": 1,
@@ -31,10 +33,41 @@ SPECIAL_SECTIONS: dict[str, int] = {
 }
 
 
+# Patterns bucketed by their first token, so a heading is checked against the
+# one or two patterns sharing its prefix instead of the whole table. The
+# "pattern " / "pattern:" prefixes are concatenated once here rather than per
+# lookup, and the tuple form lets one startswith call test both.
+_FIRST_TOKEN_MAP: dict[str, list[tuple[str, tuple[str, str], int]]] = {}
+for _pattern, _level in SPECIAL_SECTIONS.items():
+    _FIRST_TOKEN_MAP.setdefault(_pattern.split(" ", 1)[0], []).append(
+        (_pattern, (f"{_pattern} ", f"{_pattern}:"), _level)
+    )
+del _pattern, _level
+
+
+@lru_cache(maxsize=4096)
 def match_special_section(heading_text: str) -> int | None:
     """Return default section level if heading matches known special sections."""
     normalized = heading_text.lower().strip()
-    for pattern, level in SPECIAL_SECTIONS.items():
-        if normalized == pattern or normalized.startswith(f"{pattern} ") or normalized.startswith(f"{pattern}:"):
+
+    # Exact matches ("abstract", "references", ...) are the overwhelmingly
+    # common case; resolve them with one hash lookup before any slicing.
+    level = SPECIAL_SECTIONS.get(normalized)
+    if level is not None:
+        return level
+
+    cut = len(normalized)
+    space = normalized.find(" ")
+    if space != -1:
+        cut = space
+    colon = normalized.find(":")
+    if colon != -1 and colon < cut:
+        cut = colon
+
+    candidates = _FIRST_TOKEN_MAP.get(normalized[:cut])
+    if candidates is None:
+        return None
+    for _pattern, prefixes, level in candidates:
+        if normalized.startswith(prefixes):
             return level
     return None
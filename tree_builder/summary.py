@@ -2,20 +2,46 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import json
+import logging
 import os
+import random
+import time
 from typing import Protocol
 from urllib import error as urlerror
 from urllib import request
 
 from tree_builder.tree import DocumentTree, postorder_nodes
 
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads  # type: ignore
+except ImportError:  # pragma: no cover
+    def _json_dumps(payload: object) -> bytes:
+        return json.dumps(payload).encode("utf-8")
+
+    _json_loads = json.loads
+
+
+LOGGER = logging.getLogger(__name__)
+
 
 def _normalize_space(text: str) -> str:
     return " ".join(text.split())
 
 
+def _strip_json_fences(text: str) -> str:
+    stripped = text.strip()
+    if stripped.startswith("```"):
+        stripped = stripped[3:]
+        if stripped.startswith("json"):
+            stripped = stripped[4:]
+        if stripped.endswith("```"):
+            stripped = stripped[:-3]
+    return stripped.strip()
+
+
 @dataclass
 class MockSummarizer:
     """Simple truncation-based summarizer for local testing."""
@@ -37,7 +63,11 @@ class MockSummarizer:
         own_content: str = "",
     ) -> str:
         own = _normalize_space(own_content)
-        children = _normalize_space(" ".join(children_summaries))
+        # Single pass over the child summaries; no intermediate concatenated
+        # string is built just to be split and re-joined again.
+        children = " ".join(
+            word for summary in children_summaries for word in summary.split()
+        )
 
         if own and children:
             merged = f"{own} {children}"
@@ -95,6 +125,8 @@ class OpenAICompatibleSummarizer:
     max_tokens: int = 250
     temperature: float = 0.2
     max_content_chars: int = 2000
+    max_retries: int = 3
+    retry_backoff_seconds: float = 1.0
 
     def summarize_leaf(self, heading: str, content: str) -> str:
         snippet = _normalize_space(content[:self.max_content_chars])
@@ -120,55 +152,163 @@ class OpenAICompatibleSummarizer:
             f"  - {s[:per_child_limit]}" for s in children_summaries
         ) if children_summaries else ""
 
-        prompt = (
+        parts = [
             "Summarize this section in 2-3 concise sentences based on its subsections.\n"
             f"Heading: {heading}\n"
-        )
+        ]
         if own:
-            prompt += f"Section overview: {own}\n"
+            parts.append(f"Section overview: {own}\n")
         if formatted_children:
-            prompt += f"Subsections:\n{formatted_children}\n"
+            parts.append(f"Subsections:\n{formatted_children}\n")
         if not own and not formatted_children:
-            prompt += "No content available.\n"
-
-        return self._chat_completion(prompt)
+            parts.append("No content available.\n")
+
+        return self._chat_completion("".join(parts))
+
+    # Leaves packed into one chat completion; sized so prompts stay well
+    # inside the context window at max_content_chars per leaf.
+    leaf_batch_group_size: int = 8
+
+    def summarize_leaves_batch(self, items: list[tuple[str, str]]) -> list[str]:
+        """Summarize several independent leaves with few requests.
+
+        Leaves are packed in groups into single chat completions that return
+        one JSON array of summaries, cutting the request count roughly
+        ``leaf_batch_group_size``-fold; the groups themselves run
+        concurrently. A group whose response cannot be parsed falls back to
+        one request per leaf.
+        """
+        if not items:
+            return []
+        if len(items) == 1:
+            return [self.summarize_leaf(*items[0])]
+        size = max(self.leaf_batch_group_size, 1)
+        groups = [items[start : start + size] for start in range(0, len(items), size)]
+        if len(groups) == 1:
+            return self._summarize_leaf_group(groups[0])
+        with ThreadPoolExecutor(max_workers=min(4, len(groups))) as executor:
+            return [
+                summary
+                for group_summaries in executor.map(self._summarize_leaf_group, groups)
+                for summary in group_summaries
+            ]
+
+    def _summarize_leaf_group(self, group: list[tuple[str, str]]) -> list[str]:
+        if len(group) == 1:
+            return [self.summarize_leaf(*group[0])]
+
+        blocks = []
+        for index, (heading, content) in enumerate(group):
+            snippet = _normalize_space(content[: self.max_content_chars]) or "No content available."
+            blocks.append(f"[{index}] Heading: {heading}\nContent: {snippet}")
+        prompt = (
+            f"Summarize each of the {len(group)} sections below in 2-3 concise "
+            "sentences. Return a JSON object {\"summaries\": [...]} with exactly "
+            f"{len(group)} strings, in input order.\n\n" + "\n\n".join(blocks)
+        )
 
-    def _chat_completion(self, user_prompt: str) -> str:
+        try:
+            raw = self._chat_completion(
+                prompt,
+                system_prompt=(
+                    "You summarize markdown sections. Return only a JSON object "
+                    'of the form {"summaries": ["...", ...]}.'
+                ),
+            )
+            parsed = _json_loads(_strip_json_fences(raw))
+            summaries = parsed.get("summaries") if isinstance(parsed, dict) else parsed
+            if (
+                isinstance(summaries, list)
+                and len(summaries) == len(group)
+                and all(isinstance(item, str) and item.strip() for item in summaries)
+            ):
+                return [_normalize_space(item) for item in summaries]
+        except (RuntimeError, ValueError):
+            pass
+
+        # Malformed batch response: pay one request per leaf rather than fail.
+        return [self.summarize_leaf(heading, content) for heading, content in group]
+
+    def summarize_parents_batch(
+        self, items: list[tuple[str, list[str], str]]
+    ) -> list[str]:
+        """Summarize several parents whose children are already summarized.
+
+        Counterpart to :meth:`summarize_leaves_batch` for one dependency wave
+        of parent nodes; the wave members are independent of each other.
+        """
+        if not items:
+            return []
+        if len(items) == 1:
+            heading, children_summaries, own_content = items[0]
+            return [self.summarize_parent(heading, children_summaries, own_content)]
+        with ThreadPoolExecutor(max_workers=min(4, len(items))) as executor:
+            return list(executor.map(lambda item: self.summarize_parent(*item), items))
+
+    def _chat_completion(
+        self,
+        user_prompt: str,
+        system_prompt: str = "You summarize markdown sections. Return plain text only.",
+    ) -> str:
         endpoint = f"{self.base_url.rstrip('/')}/chat/completions"
         payload = {
             "model": self.model,
             "messages": [
-                {
-                    "role": "system",
-                    "content": "You summarize markdown sections. Return plain text only.",
-                },
+                {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt},
             ],
             "temperature": self.temperature,
             "max_tokens": self.max_tokens,
         }
-        data = json.dumps(payload).encode("utf-8")
+        data = _json_dumps(payload)
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
-        req = request.Request(endpoint, data=data, headers=headers, method="POST")
+        retries = max(1, self.max_retries)
+        response_body = b""
+        for attempt in range(1, retries + 1):
+            req = request.Request(endpoint, data=data, headers=headers, method="POST")
+            try:
+                with request.urlopen(req, timeout=self.timeout_seconds) as response:
+                    response_body = response.read()
+                break
+            except urlerror.HTTPError as exc:
+                details = exc.read().decode("utf-8", errors="ignore")
+                # Retry only transient statuses; 4xx client errors fail fast.
+                if exc.code in {429, 500, 502, 503, 504} and attempt < retries:
+                    wait_seconds = self._retry_delay(attempt, exc.headers.get("Retry-After"))
+                    LOGGER.warning(
+                        "HTTP %d from summarizer endpoint, retrying in %.1fs (attempt %d/%d).",
+                        exc.code,
+                        wait_seconds,
+                        attempt,
+                        retries,
+                    )
+                    time.sleep(wait_seconds)
+                    continue
+                raise RuntimeError(
+                    f"OpenAI request failed with status {exc.code}: {details[:300]}"
+                ) from exc
+            except urlerror.URLError as exc:
+                if attempt < retries:
+                    wait_seconds = self._retry_delay(attempt, None)
+                    LOGGER.warning(
+                        "Summarizer request error: %s. Retrying in %.1fs (attempt %d/%d).",
+                        exc.reason,
+                        wait_seconds,
+                        attempt,
+                        retries,
+                    )
+                    time.sleep(wait_seconds)
+                    continue
+                raise RuntimeError(f"OpenAI request failed: {exc.reason}") from exc
 
         try:
-            with request.urlopen(req, timeout=self.timeout_seconds) as response:
-                response_body = response.read().decode("utf-8")
-        except urlerror.HTTPError as exc:
-            details = exc.read().decode("utf-8", errors="ignore")
-            raise RuntimeError(
-                f"OpenAI request failed with status {exc.code}: {details[:300]}"
-            ) from exc
-        except urlerror.URLError as exc:
-            raise RuntimeError(f"OpenAI request failed: {exc.reason}") from exc
-
-        try:
-            parsed = json.loads(response_body)
+            # Both stdlib json and orjson accept the raw bytes directly.
+            parsed = _json_loads(response_body)
             content = parsed["choices"][0]["message"]["content"]
-        except (json.JSONDecodeError, KeyError, IndexError, TypeError) as exc:
+        except (ValueError, KeyError, IndexError, TypeError) as exc:
             raise RuntimeError("OpenAI response format is invalid.") from exc
 
         if isinstance(content, list):
@@ -183,6 +323,16 @@ class OpenAICompatibleSummarizer:
             raise RuntimeError("OpenAI returned an empty summary.")
         return normalized
 
+    def _retry_delay(self, attempt: int, retry_after: str | None) -> float:
+        delay = self.retry_backoff_seconds * (2 ** (attempt - 1))
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                pass
+        # Jitter spreads retries from the concurrent wave workers apart.
+        return delay + random.uniform(0.0, 0.25)
+
 
 def build_llm_summarizer_from_env(provider: str) -> Summarizer:
     provider_normalized = provider.lower().strip()
@@ -212,25 +362,56 @@ def build_llm_summarizer_from_env(provider: str) -> Summarizer:
 
 
 def generate_summaries(tree: DocumentTree, summarizer: Summarizer) -> None:
-    """Generate summaries bottom-up for all non-root nodes."""
-    for node in postorder_nodes(tree.root):
-        if node.level == 0:
-            continue
-
-        if node.is_leaf:
+    """Generate summaries bottom-up for all non-root nodes.
+
+    Nodes are processed in dependency waves: all leaves first, then any
+    parent whose children are all summarized. Members of one wave are
+    independent, so summarizers exposing the batch entry points (the
+    LLM-backed one does) run each wave's blocking requests concurrently
+    instead of one network round-trip per node.
+    """
+    nodes = [node for node in postorder_nodes(tree.root) if node.level != 0]
+    leaves = [node for node in nodes if node.is_leaf]
+    pending = [node for node in nodes if not node.is_leaf]
+
+    leaf_batch = getattr(summarizer, "summarize_leaves_batch", None)
+    if leaf_batch is not None and len(leaves) > 1:
+        summaries = leaf_batch([(node.heading, node.content) for node in leaves])
+        for node, summary in zip(leaves, summaries):
+            node.summary = summary
+    else:
+        for node in leaves:
             node.summary = summarizer.summarize_leaf(node.heading, node.content)
-            continue
 
-        children_summaries = [
-            f"{child.heading}: {child.summary}"
-            for child in node.children
-            if child.summary
+    parent_batch = getattr(summarizer, "summarize_parents_batch", None)
+    done = {id(node) for node in leaves}
+    while pending:
+        wave = [
+            node
+            for node in pending
+            if all(id(child) in done for child in node.children)
         ]
-        if node.content.strip():
-            node.summary = summarizer.summarize_parent(
+        if not wave:  # defensive: never stall on an inconsistent tree
+            wave = [pending[0]]
+        items = [
+            (
                 node.heading,
-                children_summaries,
-                own_content=node.content,
+                [
+                    f"{child.heading}: {child.summary}"
+                    for child in node.children
+                    if child.summary
+                ],
+                node.content if node.content.strip() else "",
             )
+            for node in wave
+        ]
+        if parent_batch is not None and len(wave) > 1:
+            for node, summary in zip(wave, parent_batch(items)):
+                node.summary = summary
         else:
-            node.summary = summarizer.summarize_parent(node.heading, children_summaries)
+            for node, (heading, children_summaries, own_content) in zip(wave, items):
+                node.summary = summarizer.summarize_parent(
+                    heading, children_summaries, own_content=own_content
+                )
+        done.update(id(node) for node in wave)
+        pending = [node for node in pending if id(node) not in done]
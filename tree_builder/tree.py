@@ -4,12 +4,25 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 import re
+import string
 from typing import Iterable, Optional
 
 from tree_builder.parser import Section
 
 
 NODE_ID_RE = re.compile(r"[^A-Za-z0-9._-]+")
+# ASCII fast path for NODE_ID_RE: one C-level translate pass per suffix. The
+# regex stays for non-ASCII suffixes (e.g. Chinese numbering strings).
+# Disallowed characters map to a NUL sentinel first so that only runs of
+# originally-disallowed characters collapse, exactly like the regex's "+";
+# literal underscores in the input must survive untouched.
+_NODE_ID_TRANS = str.maketrans(
+    {
+        char: "\x00"
+        for char in map(chr, range(128))
+        if char not in set(string.ascii_letters + string.digits + "._-")
+    }
+)
 
 
 @dataclass
@@ -42,7 +55,13 @@ class DocumentTree:
 
 
 def _sanitize_node_suffix(raw_suffix: str, fallback_index: int) -> str:
-    suffix = NODE_ID_RE.sub("_", raw_suffix).strip("_")
+    if raw_suffix.isascii():
+        suffix = raw_suffix.translate(_NODE_ID_TRANS)
+        while "\x00\x00" in suffix:
+            suffix = suffix.replace("\x00\x00", "\x00")
+        suffix = suffix.replace("\x00", "_").strip("_")
+    else:
+        suffix = NODE_ID_RE.sub("_", raw_suffix).strip("_")
     if suffix:
         return suffix
     return f"s{fallback_index}"
@@ -129,20 +148,25 @@ def build_document_tree(
 
 def postorder_nodes(root: TreeNode) -> list[TreeNode]:
     """Return tree nodes in post-order, including root as the last element."""
-    ordered: list[TreeNode] = []
-
-    def visit(node: TreeNode) -> None:
-        for child in node.children:
-            visit(child)
+    # Reversed pre-order with children pushed left-to-right; reversing the
+    # result yields post-order without per-node recursion frames.
+    ordered: list[TreeNode] = [root]
+    stack = list(root.children)
+    while stack:
+        node = stack.pop()
         ordered.append(node)
-
-    visit(root)
+        stack.extend(node.children)
+    ordered.reverse()
     return ordered
 
 
 def validate_and_fix_tree(root: TreeNode, max_depth: int = 3) -> list[str]:
     """Validate and repair common structural issues after level inference."""
+    # Level repair and empty-leaf detection share one traversal; pruning is
+    # applied afterwards per parent with a single filtered rebuild instead of
+    # an O(len(children)) remove() per pruned node.
     fixes: list[str] = []
+    prune: list[TreeNode] = []
 
     for node in traverse_all_nodes(root):
         if node.parent is None:
@@ -167,13 +191,19 @@ def validate_and_fix_tree(root: TreeNode, max_depth: int = 3) -> list[str]:
                 f"Depth overflow adjusted: {node.heading} L{old_level} -> L{node.level}"
             )
 
-    for node in list(traverse_all_nodes(root)):
-        if node is root:
-            continue
         if not node.children and not node.content.strip():
+            prune.append(node)
+
+    if prune:
+        prune_ids = {id(node) for node in prune}
+        seen_parents: set[int] = set()
+        for node in prune:
             parent = node.parent
-            if parent is not None and node in parent.children:
-                parent.children.remove(node)
-                fixes.append(f"Empty node pruned: {node.heading}")
+            if parent is not None and id(parent) not in seen_parents:
+                seen_parents.add(id(parent))
+                parent.children = [
+                    child for child in parent.children if id(child) not in prune_ids
+                ]
+        fixes.extend(f"Empty node pruned: {node.heading}" for node in prune)
 
     return fixes
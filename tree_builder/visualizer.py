@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+import sys
 from typing import Any
 
-from tree_builder.tree import DocumentTree, TreeNode
+from tree_builder.tree import DocumentTree, TreeNode, postorder_nodes
 
 
 def _summary_preview(summary: str, max_chars: int) -> str:
@@ -14,16 +15,22 @@ def _summary_preview(summary: str, max_chars: int) -> str:
 
 
 def _node_to_dict(node: TreeNode) -> dict[str, Any]:
-    return {
-        "node_id": node.node_id,
-        "heading": node.heading,
-        "level": node.level,
-        "content": node.content,
-        "summary": node.summary,
-        "heading_path": node.heading_path,
-        "is_leaf": node.is_leaf,
-        "children": [_node_to_dict(child) for child in node.children],
-    }
+    # Built bottom-up over the iterative postorder, so child dicts always
+    # exist when their parent is assembled and deep trees cannot hit the
+    # recursion limit.
+    dict_by_id: dict[int, dict[str, Any]] = {}
+    for current in postorder_nodes(node):
+        dict_by_id[id(current)] = {
+            "node_id": current.node_id,
+            "heading": current.heading,
+            "level": current.level,
+            "content": current.content,
+            "summary": current.summary,
+            "heading_path": current.heading_path,
+            "is_leaf": current.is_leaf,
+            "children": [dict_by_id[id(child)] for child in current.children],
+        }
+    return dict_by_id[id(node)]
 
 
 def document_tree_to_dict(tree: DocumentTree) -> dict[str, Any]:
@@ -36,32 +43,69 @@ def document_tree_to_dict(tree: DocumentTree) -> dict[str, Any]:
     }
 
 
+def _node_shallow_dict(node: TreeNode) -> dict[str, Any]:
+    # One level only; the JSON encoder recurses into the TreeNode children
+    # itself, so no fully materialized nested dict is ever built.
+    return {
+        "node_id": node.node_id,
+        "heading": node.heading,
+        "level": node.level,
+        "content": node.content,
+        "summary": node.summary,
+        "heading_path": node.heading_path,
+        "is_leaf": node.is_leaf,
+        "children": node.children,
+    }
+
+
 def export_document_tree_json(tree: DocumentTree, output_path: Path) -> None:
-    """Export tree to JSON file."""
+    """Export tree to JSON file, using orjson when available."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(
-        json.dumps(document_tree_to_dict(tree), ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    try:
+        # orjson caps `default` recursion too low for nested nodes, so this
+        # path serializes the materialized dict; it is fast enough that the
+        # intermediate structure is an acceptable trade.
+        import orjson  # type: ignore
+
+        output_path.write_bytes(
+            orjson.dumps(document_tree_to_dict(tree), option=orjson.OPT_INDENT_2)
+        )
+    except ImportError:
+        payload = {
+            "doc_id": tree.doc_id,
+            "node_count": tree.node_count,
+            "leaf_count": tree.leaf_count,
+            "tree": tree.root,
+        }
+        with output_path.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle, ensure_ascii=False, indent=2, default=_node_shallow_dict)
 
 
 def print_document_tree(tree: DocumentTree, summary_preview_chars: int = 50) -> None:
     """Print a readable ASCII tree with summary and content info."""
-    print(f"Document Tree: {tree.doc_id} ({tree.node_count} nodes, {tree.leaf_count} leaves)")
-    print("=" * 60)
-
-    def print_node(node: TreeNode, prefix: str, is_last: bool) -> None:
+    # Lines are accumulated and flushed with one write, so rendering a wide
+    # tree costs one stdout syscall instead of several per node.
+    buffer: list[str] = [
+        f"Document Tree: {tree.doc_id} ({tree.node_count} nodes, {tree.leaf_count} leaves)\n",
+        "=" * 60 + "\n",
+    ]
+
+    def render_node(node: TreeNode, prefix: str, is_last: bool) -> None:
         connector = "`-- " if is_last else "|-- "
         leaf_mark = " <- LEAF" if node.is_leaf else ""
-        print(f"{prefix}{connector}[L{node.level}] {node.heading} ({len(node.content)} chars){leaf_mark}")
+        buffer.append(
+            f"{prefix}{connector}[L{node.level}] {node.heading} ({len(node.content)} chars){leaf_mark}\n"
+        )
 
         summary_prefix = "    " if is_last else "|   "
         preview = _summary_preview(node.summary, summary_preview_chars)
-        print(f"{prefix}{summary_prefix}Summary: \"{preview}\"")
+        buffer.append(f"{prefix}{summary_prefix}Summary: \"{preview}\"\n")
 
         child_prefix = prefix + ("    " if is_last else "|   ")
         for index, child in enumerate(node.children):
-            print_node(child, child_prefix, index == len(node.children) - 1)
+            render_node(child, child_prefix, index == len(node.children) - 1)
 
     for index, child in enumerate(tree.root.children):
-        print_node(child, "", index == len(tree.root.children) - 1)
+        render_node(child, "", index == len(tree.root.children) - 1)
+
+    sys.stdout.write("".join(buffer))
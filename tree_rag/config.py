@@ -8,35 +8,40 @@ from tree_builder.env import load_env
 from tree_rag.types import RagConfig
 
 
-def _get_float(name: str, default: float) -> float:
-    raw = os.getenv(name, "").strip()
+_TRUE_WORDS = frozenset({"1", "true", "t", "yes", "y", "on"})
+_FALSE_WORDS = frozenset({"0", "false", "f", "no", "n", "off"})
+
+
+def _parse_bool(raw: str) -> bool:
+    lowered = raw.lower()
+    if lowered in _TRUE_WORDS:
+        return True
+    if lowered in _FALSE_WORDS:
+        return False
+    raise ValueError(raw)
+
+
+def _get(name: str, default, cast):
+    """Shared getenv + strip + cast-with-fallback dance for all value types."""
+    raw = os.environ.get(name, "").strip()
     if not raw:
         return default
     try:
-        return float(raw)
+        return cast(raw)
     except ValueError:
         return default
 
 
+def _get_float(name: str, default: float) -> float:
+    return _get(name, default, float)
+
+
 def _get_int(name: str, default: int) -> int:
-    raw = os.getenv(name, "").strip()
-    if not raw:
-        return default
-    try:
-        return int(raw)
-    except ValueError:
-        return default
+    return _get(name, default, int)
 
 
 def _get_bool(name: str, default: bool) -> bool:
-    raw = os.getenv(name, "").strip().lower()
-    if not raw:
-        return default
-    if raw in {"1", "true", "t", "yes", "y", "on"}:
-        return True
-    if raw in {"0", "false", "f", "no", "n", "off"}:
-        return False
-    return default
+    return _get(name, default, _parse_bool)
 
 
 def load_rag_config(load_dotenv: bool = True) -> RagConfig:
@@ -58,4 +63,5 @@ def load_rag_config(load_dotenv: bool = True) -> RagConfig:
         bm25_weight=_get_float("RAG_BM25_WEIGHT", 0.5),
         rerank_diversify=_get_bool("RAG_RERANK_DIVERSIFY", True),
         rerank_min_unique_nodes=max(0, _get_int("RAG_RERANK_MIN_UNIQUE_NODES", 0)),
+        rerank_cache_ttl_seconds=max(0.0, _get_float("RAG_RERANK_CACHE_TTL", 0.0)),
     )
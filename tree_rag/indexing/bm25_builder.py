@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from collections import Counter
 import math
-from typing import Protocol
+from typing import Any, Protocol
+
+import numpy as np
 
 
 class BM25Like(Protocol):
@@ -24,49 +27,99 @@ class FallbackBM25:
             if self.doc_count
             else 0.0
         )
-        self.doc_freq: dict[str, int] = {}
-        for doc in tokenized_docs:
-            for token in set(doc):
-                self.doc_freq[token] = self.doc_freq.get(token, 0) + 1
-
-        self.term_freq: list[dict[str, int]] = []
-        for doc in tokenized_docs:
-            tf: dict[str, int] = {}
-            for token in doc:
-                tf[token] = tf.get(token, 0) + 1
-            self.term_freq.append(tf)
+        self.doc_lengths = np.array([len(doc) for doc in tokenized_docs], dtype=np.float64)
+
+        # Inverted index: term -> (doc ids, term frequencies) as parallel
+        # arrays, so scoring touches only the documents containing a query
+        # term instead of walking the whole corpus per token.
+        postings: dict[str, tuple[list[int], list[int]]] = {}
+        for idx, doc in enumerate(tokenized_docs):
+            # Counter counts in C, replacing the per-token dict.get loop.
+            for token, freq in Counter(doc).items():
+                entry = postings.get(token)
+                if entry is None:
+                    entry = ([], [])
+                    postings[token] = entry
+                entry[0].append(idx)
+                entry[1].append(freq)
+
+        self.doc_freq: dict[str, int] = {token: len(entry[0]) for token, entry in postings.items()}
+        self._postings: dict[str, tuple[np.ndarray, np.ndarray]] = {
+            token: (
+                np.array(doc_ids, dtype=np.intp),
+                np.array(freqs, dtype=np.float64),
+            )
+            for token, (doc_ids, freqs) in postings.items()
+        }
+
+        # Both the IDF of a term and the per-document denominator part are
+        # fixed once the corpus is known; computing them here keeps get_scores
+        # free of per-query math.log calls and array rebuilds.
+        self._idf_by_token: dict[str, float] = {
+            token: math.log(1.0 + (self.doc_count - df + 0.5) / (df + 0.5))
+            for token, df in self.doc_freq.items()
+        }
+        self._denom_base = self.k1 * (
+            1.0 - self.b + self.b * (self.doc_lengths / (self.avgdl or 1.0))
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The postings, IDF table, and denominator base are derived and cheap
+        # to rebuild, so only the corpus and parameters go into bm25.pkl.
+        return {"tokenized_docs": self.tokenized_docs, "k1": self.k1, "b": self.b}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Pickles written before the postings/IDF precomputation carry the old
+        # attribute set; both layouts include tokenized_docs, k1, and b, so
+        # rebuilding through __init__ restores the derived state either way.
+        self.__init__(state["tokenized_docs"], state.get("k1", 1.5), state.get("b", 0.75))
 
     def _idf(self, token: str) -> float:
-        n_q = self.doc_freq.get(token, 0)
-        if n_q == 0:
-            return 0.0
-        numerator = self.doc_count - n_q + 0.5
-        denominator = n_q + 0.5
-        return math.log(1.0 + numerator / denominator)
+        return self._idf_by_token.get(token, 0.0)
+
+    def get_scores_np(self, query_tokens: list[str]) -> np.ndarray:
+        """Score the corpus and return the raw float array without boxing."""
+        scores = np.zeros(self.doc_count, dtype=np.float64)
+        denom_base = self._denom_base
+        tf_scale = self.k1 + 1.0
+        for token in query_tokens:
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+            doc_ids, freqs = posting
+            # doc_ids within one posting are unique, so fancy-index add is safe.
+            scores[doc_ids] += self._idf_by_token[token] * (freqs * tf_scale) / (freqs + denom_base[doc_ids])
+        return scores
 
     def get_scores(self, query_tokens: list[str]) -> list[float]:
-        if not self.tokenized_docs:
+        if not self.doc_count:
             return []
-        scores = [0.0 for _ in self.tokenized_docs]
-        for idx, doc_tokens in enumerate(self.tokenized_docs):
-            dl = len(doc_tokens)
-            tf = self.term_freq[idx]
-            score = 0.0
-            for token in query_tokens:
-                f = tf.get(token, 0)
-                if f == 0:
-                    continue
-                idf = self._idf(token)
-                denominator = f + self.k1 * (1.0 - self.b + self.b * (dl / (self.avgdl or 1.0)))
-                score += idf * ((f * (self.k1 + 1.0)) / denominator)
-            scores[idx] = score
-        return scores
+        return self.get_scores_np(query_tokens).tolist()
+
+    def top_k(self, query_tokens: list[str], k: int) -> tuple[list[int], list[float]]:
+        """Return the indices and scores of the k best documents.
+
+        argpartition keeps selection at O(N) instead of sorting the whole
+        score vector; only the k winners are sorted.
+        """
+        if k <= 0 or not self.doc_count:
+            return [], []
+        scores = self.get_scores_np(query_tokens)
+        k = min(k, scores.size)
+        candidates = np.argpartition(-scores, k - 1)[:k]
+        order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return order.tolist(), scores[order].tolist()
 
 
 def build_bm25_index(tokenized_chunks: list[list[str]]) -> BM25Like:
-    try:
-        from rank_bm25 import BM25Okapi  # type: ignore
+    # BM25Okapi divides by the vocabulary size at construction time, so an
+    # empty corpus (or one where every chunk tokenized to nothing) must take
+    # the fallback path, which handles it gracefully.
+    if any(tokenized_chunks):
+        try:
+            from rank_bm25 import BM25Okapi  # type: ignore
 
-        return BM25Okapi(tokenized_chunks)
-    except ImportError:
-        return FallbackBM25(tokenized_chunks)
+            return BM25Okapi(tokenized_chunks)
+        except ImportError:
+            pass
+    return FallbackBM25(tokenized_chunks)
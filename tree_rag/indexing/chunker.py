@@ -17,21 +17,26 @@ def chunk_content(
         step = 1
 
     chunks: list[str] = []
-    paragraphs = [para.strip() for para in content.split("\n\n")]
-    for paragraph in paragraphs:
-        if len(paragraph) < min_chars:
+    for raw_paragraph in content.split("\n\n"):
+        paragraph = raw_paragraph.strip()
+        length = len(paragraph)
+        if length < min_chars:
             continue
 
-        if len(paragraph) <= chunk_size:
+        if length <= chunk_size:
             chunks.append(paragraph)
             continue
 
-        start = 0
-        while start < len(paragraph):
-            end = min(start + chunk_size, len(paragraph))
-            piece = paragraph[start:end].strip()
+        for start in range(0, length, step):
+            end = start + chunk_size
+            if end > length:
+                end = length
+            piece = paragraph[start:end]
+            # The paragraph is already stripped; interior slices only need a
+            # strip when they happen to land on whitespace boundaries.
+            if piece[0].isspace() or piece[-1].isspace():
+                piece = piece.strip()
             if len(piece) >= min_chars:
                 chunks.append(piece)
-            start += step
 
     return chunks
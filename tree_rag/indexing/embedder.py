@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
 import logging
 from typing import Protocol
 
+import numpy as np
+
 from tree_rag.types import RagConfig
 from tree_rag.utils.openai_client import OpenAICompatibleClient
 
@@ -14,21 +17,8 @@ LOGGER = logging.getLogger(__name__)
 
 
 class Embedder(Protocol):
-    def embed_texts(self, texts: list[str]) -> list[list[float]]:
-        """Generate embeddings for the given texts."""
-
-
-def _hash_embedding(text: str, dim: int = 64) -> list[float]:
-    digest = hashlib.sha256(text.encode("utf-8")).digest()
-    values: list[float] = []
-    cursor = digest
-    while len(values) < dim:
-        for byte in cursor:
-            values.append((byte / 255.0) * 2.0 - 1.0)
-            if len(values) >= dim:
-                break
-        cursor = hashlib.sha256(cursor).digest()
-    return values
+    def embed_texts(self, texts: list[str]) -> list[list[float]] | np.ndarray:
+        """Generate embeddings for the given texts, one row per text."""
 
 
 class MockEmbedder:
@@ -36,23 +26,39 @@ class MockEmbedder:
         self.dim = dim
 
     def embed_texts(self, texts: list[str]) -> list[list[float]]:
-        return [_hash_embedding(text, dim=self.dim) for text in texts]
+        if not texts:
+            return []
+        # SHAKE-128 emits exactly dim deterministic bytes per text in one C
+        # call; the byte -> [-1, 1] transform runs once over the whole matrix.
+        matrix = np.empty((len(texts), self.dim), dtype=np.float64)
+        for row, text in enumerate(texts):
+            raw = hashlib.shake_128(text.encode("utf-8")).digest(self.dim)
+            matrix[row] = np.frombuffer(raw, dtype=np.uint8)
+        return (matrix * (2.0 / 255.0) - 1.0).tolist()
 
 
 class OpenAIEmbedder:
-    def __init__(self, client: OpenAICompatibleClient, model: str, batch_size: int = 10) -> None:
+    def __init__(
+        self,
+        client: OpenAICompatibleClient,
+        model: str,
+        batch_size: int = 10,
+        max_workers: int = 8,
+    ) -> None:
         self.client = client
         self.model = model
         self.batch_size = batch_size
+        self.max_workers = max_workers
 
-    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+    def embed_texts(self, texts: list[str]) -> np.ndarray:
         if not texts:
-            return []
-        vectors: list[list[float]] = []
-        total_batches = (len(texts) + self.batch_size - 1) // self.batch_size
-        for start in range(0, len(texts), self.batch_size):
-            batch = texts[start : start + self.batch_size]
-            batch_number = (start // self.batch_size) + 1
+            return np.empty((0, 0), dtype=np.float32)
+        batches = [
+            texts[start : start + self.batch_size]
+            for start in range(0, len(texts), self.batch_size)
+        ]
+        total_batches = len(batches)
+        for batch_number, batch in enumerate(batches, start=1):
             LOGGER.info(
                 "Embedding batch %d/%d (size=%d) using model=%s",
                 batch_number,
@@ -60,9 +66,24 @@ class OpenAIEmbedder:
                 len(batch),
                 self.model,
             )
-            vectors.extend(self.client.embeddings(model=self.model, texts=batch))
+        if total_batches == 1:
+            matrix = self.client.embeddings_array(model=self.model, texts=batches[0])
+        else:
+            # The sub-batches are independent HTTP requests, so issue them
+            # concurrently; futures are collected in submission order to keep
+            # rows aligned with texts.
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, total_batches)
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self.client.embeddings_array, model=self.model, texts=batch
+                    )
+                    for batch in batches
+                ]
+                matrix = np.vstack([future.result() for future in futures])
         LOGGER.info("Embedding completed for %d texts.", len(texts))
-        return vectors
+        return matrix
 
 
 def build_embedder(
@@ -20,6 +20,20 @@ from tree_rag.types import Chunk, IndexedNode, RagConfig, RagIndex
 from tree_rag.utils.openai_client import OpenAICompatibleClient
 from tree_rag.utils.tokenizer import tokenize
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps_bytes = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 
 LOGGER = logging.getLogger(__name__)
 
@@ -53,7 +67,7 @@ def load_tree_input(input_path: Path) -> dict[str, Any]:
     suffix = input_path.suffix.lower()
     if suffix == ".json" and input_path.name.endswith(".tree.json"):
         LOGGER.info("Reading prebuilt tree json: %s", input_path)
-        return json.loads(input_path.read_text(encoding="utf-8"))
+        return json.loads(input_path.read_bytes())
 
     if suffix == ".md":
         LOGGER.info("Reading markdown source: %s", input_path)
@@ -88,6 +102,11 @@ def build_index_from_tree(
     nodes: dict[str, IndexedNode] = {}
     all_chunks: list[Chunk] = []
 
+    # First pass: chunk every leaf and queue the texts, so the embedder sees
+    # one document-wide batch instead of one small call per leaf. The OpenAI
+    # embedder splits that batch into provider-sized requests itself.
+    leaf_specs: list[tuple[str, str, list[str], int]] = []
+    all_texts: list[str] = []
     for position, leaf in enumerate(leaves, start=1):
         node_id = str(leaf.get("node_id", "")).strip()
         heading_path = str(leaf.get("heading_path", leaf.get("heading", node_id)))
@@ -100,20 +119,26 @@ def build_index_from_tree(
             node_id,
             len(chunk_texts),
         )
+        leaf_specs.append((node_id, heading_path, chunk_texts, len(all_texts)))
+        all_texts.extend(chunk_texts)
 
+    all_vectors = embedder.embed_texts(all_texts) if all_texts else []
+
+    for node_id, heading_path, chunk_texts, start in leaf_specs:
         chunks: list[Chunk] = []
-        if chunk_texts:
-            vectors = embedder.embed_texts(chunk_texts)
-            for idx, (text, vector) in enumerate(zip(chunk_texts, vectors)):
-                chunk = Chunk(
-                    chunk_id=f"{node_id}_chunk_{idx:02d}",
-                    text=text,
-                    source_node_id=node_id,
-                    heading_path=heading_path,
-                    embedding=[float(x) for x in vector],
-                )
-                chunks.append(chunk)
-                all_chunks.append(chunk)
+        for idx, text in enumerate(chunk_texts):
+            # float32 rows end-to-end: API embedders already return a matrix,
+            # and list-returning mocks convert once here instead of boxing
+            # every value as a Python float.
+            chunk = Chunk(
+                chunk_id=f"{node_id}_chunk_{idx:02d}",
+                text=text,
+                source_node_id=node_id,
+                heading_path=heading_path,
+                embedding=np.asarray(all_vectors[start + idx], dtype=np.float32),
+            )
+            chunks.append(chunk)
+            all_chunks.append(chunk)
 
         tokenized = [tokenize(chunk.text) for chunk in chunks] if chunks else [[]]
         bm25_index = build_bm25_index(tokenized)
@@ -152,20 +177,26 @@ def save_index(index: RagIndex, output_dir: Path) -> None:
         for node_id, node in index.nodes.items()
     }
 
+    # The tree lives in its own compact file so metadata.json stays small and
+    # human-readable; older indexes with tree_data embedded in metadata.json
+    # still load.
     metadata = {
         "doc_id": index.doc_id,
         "node_count": len(index.nodes),
         "chunk_count": len(index.all_chunks),
         "node_chunk_ids": node_chunk_ids,
         "node_heading_paths": node_heading_paths,
-        "tree_data": index.tree_data,
     }
     (output_dir / "metadata.json").write_text(
         json.dumps(metadata, ensure_ascii=False, indent=2),
         encoding="utf-8",
     )
+    (output_dir / "tree.json").write_bytes(_json_dumps_bytes(index.tree_data))
 
-    with (output_dir / "chunks.jsonl").open("w", encoding="utf-8") as handle:
+    # Rows are batched and joined before hitting the (1 MiB-buffered) file so
+    # large corpora do not pay one write call and one bytes concat per row.
+    with (output_dir / "chunks.jsonl").open("wb", buffering=1 << 20) as handle:
+        buffer: list[bytes] = []
         for chunk in index.all_chunks:
             row = {
                 "chunk_id": chunk.chunk_id,
@@ -173,33 +204,54 @@ def save_index(index: RagIndex, output_dir: Path) -> None:
                 "source_node_id": chunk.source_node_id,
                 "heading_path": chunk.heading_path,
             }
-            handle.write(json.dumps(row, ensure_ascii=False) + "\n")
+            buffer.append(_json_dumps_bytes(row))
+            buffer.append(b"\n")
+            if len(buffer) >= 2048:
+                handle.write(b"".join(buffer))
+                buffer.clear()
+        if buffer:
+            handle.write(b"".join(buffer))
 
     if index.all_chunks:
-        matrix = np.array([chunk.embedding for chunk in index.all_chunks], dtype=float)
+        # Rows fill one preallocated float16 matrix: cosine retrieval ranks by
+        # relative similarity, for which half precision is ample, and this
+        # quarters the file plus the load/mmap bandwidth versus float64. The
+        # retriever promotes rows back to float32 when it stacks its cached
+        # scoring matrix.
+        dim = len(index.all_chunks[0].embedding)
+        matrix = np.empty((len(index.all_chunks), dim), dtype=np.float16)
+        for row, chunk in enumerate(index.all_chunks):
+            matrix[row] = chunk.embedding
     else:
-        matrix = np.empty((0, 0), dtype=float)
+        matrix = np.empty((0, 0), dtype=np.float16)
     np.save(output_dir / "embeddings.npy", matrix)
 
     bm25_map = {node_id: node.bm25_index for node_id, node in index.nodes.items()}
     with (output_dir / "bm25.pkl").open("wb") as handle:
         pickle.dump(bm25_map, handle)
-    LOGGER.info("Index files saved: metadata.json, chunks.jsonl, embeddings.npy, bm25.pkl")
+    LOGGER.info(
+        "Index files saved: metadata.json, tree.json, chunks.jsonl, embeddings.npy, bm25.pkl"
+    )
 
 
 def load_index(index_dir: Path) -> RagIndex:
     LOGGER.info("Loading index files from directory: %s", index_dir)
-    metadata = json.loads((index_dir / "metadata.json").read_text(encoding="utf-8"))
-    tree_data = metadata["tree_data"]
+    metadata = _json_loads((index_dir / "metadata.json").read_bytes())
+    tree_path = index_dir / "tree.json"
+    if tree_path.exists():
+        tree_data = _json_loads(tree_path.read_bytes())
+    else:
+        # Indexes written before the tree was split out embed it in metadata.
+        tree_data = metadata["tree_data"]
     node_chunk_ids = metadata["node_chunk_ids"]
     node_heading_paths = metadata["node_heading_paths"]
 
     chunks: list[Chunk] = []
-    with (index_dir / "chunks.jsonl").open("r", encoding="utf-8") as handle:
+    with (index_dir / "chunks.jsonl").open("rb") as handle:
         for line in handle:
             if not line.strip():
                 continue
-            row = json.loads(line)
+            row = _json_loads(line)
             chunks.append(
                 Chunk(
                     chunk_id=row["chunk_id"],
@@ -210,10 +262,14 @@ def load_index(index_dir: Path) -> RagIndex:
                 )
             )
 
-    matrix = np.load(index_dir / "embeddings.npy")
+    # Memory-mapped: rows are paged in on demand instead of reading the whole
+    # matrix into RAM, and concurrent loaders share the same physical pages.
+    # The file must not be modified while an index loaded from it is in use.
+    matrix = np.load(index_dir / "embeddings.npy", mmap_mode="r")
     for idx, chunk in enumerate(chunks):
         if idx < len(matrix):
-            chunk.embedding = [float(x) for x in matrix[idx].tolist()]
+            # Row views share the matrix buffer; no per-chunk Python floats.
+            chunk.embedding = matrix[idx]
         else:
             chunk.embedding = []
 
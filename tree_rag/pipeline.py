@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 from tree_rag.indexing.embedder import build_embedder
@@ -16,6 +17,33 @@ from tree_rag.utils.openai_client import OpenAICompatibleClient
 LOGGER = logging.getLogger(__name__)
 
 
+# One-slot embedder cache: interactive mode runs the pipeline once per query
+# with the same config and client, and rebuilding the embedder each time is
+# wasted work (and would be seconds per query for local-model embedders).
+# The client is compared by identity; holding it in the slot keeps that safe.
+_EMBEDDER_CACHE: tuple[str, str, bool, OpenAICompatibleClient | None, object] | None = None
+
+
+def _cached_embedder(
+    config: RagConfig,
+    mock: bool,
+    client: OpenAICompatibleClient | None,
+):
+    global _EMBEDDER_CACHE
+    cached = _EMBEDDER_CACHE
+    if (
+        cached is not None
+        and cached[0] == config.embed_model
+        and cached[1] == config.openai_base_url
+        and cached[2] == mock
+        and cached[3] is client
+    ):
+        return cached[4]
+    embedder = build_embedder(config=config, mock=mock, client=client)
+    _EMBEDDER_CACHE = (config.embed_model, config.openai_base_url, mock, client, embedder)
+    return embedder
+
+
 def run_pipeline(
     query: str,
     index: RagIndex,
@@ -36,36 +64,77 @@ def run_pipeline(
     LOGGER.info("Step 1/3 thinking: %s", thinking)
 
     LOGGER.info("Step 2/3 Hybrid Retrieval started.")
-    embedder = build_embedder(config=config, mock=mock, client=client)
+    embedder = _cached_embedder(config=config, mock=mock, client=client)
 
-    def _embed_query(text: str) -> list[float]:
-        vectors = embedder.embed_texts([text])
-        if not vectors:
-            return []
-        return vectors[0]
+    # Sub-queries often repeat (the keyword fallback reuses the user query for
+    # every located node), so memoize per query run to avoid redundant
+    # embedding round trips.
+    embed_cache: dict[str, object] = {}
 
-    all_retrieved = []
-    for node_info in located_nodes:
-        node = index.nodes.get(node_info.node_id)
+    def _embed_query(text: str):
+        cached = embed_cache.get(text)
+        if cached is None:
+            vectors = embedder.embed_texts([text])
+            # len() instead of truthiness: embed_texts may return an ndarray.
+            cached = vectors[0] if len(vectors) else []
+            embed_cache[text] = cached
+        return cached
+
+    resolved = [
+        (node_info, index.nodes.get(node_info.node_id)) for node_info in located_nodes
+    ]
+    for node_info, node in resolved:
         if node is None:
             LOGGER.warning("Located node '%s' is missing in index, skipping.", node_info.node_id)
-            continue
+
+    # Embed every distinct sub-query in one batched call up front: one round
+    # trip to the embedding endpoint instead of one per located node.
+    distinct_sub_queries = list(
+        dict.fromkeys(
+            node_info.sub_query for node_info, node in resolved if node is not None
+        )
+    )
+    if distinct_sub_queries:
+        embed_cache.update(
+            zip(distinct_sub_queries, embedder.embed_texts(distinct_sub_queries))
+        )
+
+    targets = [(node_info, node) for node_info, node in resolved if node is not None]
+    for node_info, node in targets:
         LOGGER.info(
             "Retrieving chunks from node %s (%d chunks in node).",
             node_info.node_id,
             len(node.chunks),
         )
-        all_retrieved.extend(
-            hybrid_retrieve(
-                node=node,
-                query=node_info.sub_query,
-                top_k=config.top_k,
-                dense_weight=config.dense_weight,
-                bm25_weight=config.bm25_weight,
-                embed_query_fn=_embed_query,
-            )
+
+    def _retrieve(node_info, node):
+        return hybrid_retrieve(
+            node=node,
+            query=node_info.sub_query,
+            top_k=config.top_k,
+            dense_weight=config.dense_weight,
+            bm25_weight=config.bm25_weight,
+            embed_query_fn=_embed_query,
+            query_embedding=embed_cache.get(node_info.sub_query),
         )
 
+    all_retrieved = []
+    if len(targets) > 1:
+        # Per-node scoring is independent and dominated by numpy/BM25 kernels
+        # that release the GIL, so located nodes (at most 5) run concurrently.
+        # Futures are collected in submission order to keep results
+        # deterministic.
+        with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+            futures = [
+                executor.submit(_retrieve, node_info, node)
+                for node_info, node in targets
+            ]
+            for future in futures:
+                all_retrieved.extend(future.result())
+    else:
+        for node_info, node in targets:
+            all_retrieved.extend(_retrieve(node_info, node))
+
     LOGGER.info("Step 2/3 retrieval completed. Candidate chunks=%d", len(all_retrieved))
     LOGGER.info("Step 2/3 rerank started.")
     reranked = rerank_chunks(
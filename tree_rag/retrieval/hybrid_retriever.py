@@ -2,11 +2,64 @@
 
 from __future__ import annotations
 
+import numpy as np
+
 from tree_rag.types import IndexedNode, RetrievedChunk
-from tree_rag.utils.similarity import cosine_similarity, min_max_normalize
+from tree_rag.utils.similarity import (
+    cosine_similarity,
+    cosine_similarity_batch,
+    min_max_normalize_np,
+)
 from tree_rag.utils.tokenizer import tokenize
 
 
+def _node_matrix(node: IndexedNode) -> np.ndarray | None:
+    """Stacked float32 chunk embeddings with cached row norms.
+
+    Built once on the first query and reused afterwards, so interactive
+    sessions hitting the same node repeatedly pay the stacking and norm
+    cost only once. Returns None for nodes with ragged or empty
+    embeddings, which a (0, 0) sentinel array remembers across calls.
+    """
+    cached = node.embedding_matrix
+    if cached is not None:
+        return cached if cached.size else None
+
+    chunks = node.chunks
+    dim = len(chunks[0].embedding) if chunks else 0
+    if dim == 0 or any(len(chunk.embedding) != dim for chunk in chunks):
+        node.embedding_matrix = np.empty((0, 0), dtype=np.float32)
+        return None
+
+    matrix = np.empty((len(chunks), dim), dtype=np.float32)
+    for row, chunk in enumerate(chunks):
+        matrix[row] = chunk.embedding
+    node.embedding_matrix = matrix
+    node.embedding_norms = np.linalg.norm(matrix, axis=1)
+    return matrix
+
+
+def _dense_scores(
+    node: IndexedNode, query_embedding: list[float] | np.ndarray
+) -> list[float]:
+    """Cosine similarity of the query against all chunk embeddings at once.
+
+    One batched matmul against the node's cached matrix replaces k
+    Python-level dot products. Ragged or empty embeddings (possible on
+    partially loaded indexes) keep the scalar path, which also defines the
+    0.0-on-mismatch semantics.
+    """
+    chunks = node.chunks
+    if not chunks:
+        return []
+    matrix = _node_matrix(node)
+    if matrix is None or matrix.shape[1] != len(query_embedding):
+        return [cosine_similarity(query_embedding, chunk.embedding) for chunk in chunks]
+
+    query = np.asarray(query_embedding, dtype=np.float32)
+    return cosine_similarity_batch(query, matrix, node.embedding_norms).tolist()
+
+
 def hybrid_retrieve(
     node: IndexedNode,
     query: str,
@@ -14,16 +67,17 @@ def hybrid_retrieve(
     dense_weight: float,
     bm25_weight: float,
     embed_query_fn,
+    query_embedding: list[float] | np.ndarray | None = None,
 ) -> list[RetrievedChunk]:
     chunks = node.chunks
     if not chunks:
         return []
 
-    query_embedding = embed_query_fn(query)
-    dense_scores = [
-        cosine_similarity(query_embedding, chunk.embedding)
-        for chunk in chunks
-    ]
+    # Callers that batch-embed several sub-queries pass the vector directly;
+    # embed_query_fn remains the single-query path.
+    if query_embedding is None:
+        query_embedding = embed_query_fn(query)
+    dense_scores = _dense_scores(node, query_embedding)
 
     tokenized_query = tokenize(query)
     if node.bm25_index is not None:
@@ -35,29 +89,31 @@ def hybrid_retrieve(
         bm25_scores.extend([0.0] * (len(chunks) - len(bm25_scores)))
     bm25_scores = bm25_scores[: len(chunks)]
 
-    dense_norm = min_max_normalize(dense_scores)
-    bm25_norm = min_max_normalize([float(v) for v in bm25_scores])
-    fused_scores = [
-        dense_weight * dense + bm25_weight * bm25
-        for dense, bm25 in zip(dense_norm, bm25_norm)
-    ]
+    # Normalize and fuse entirely in numpy: no intermediate Python lists
+    # between the raw scores and the fused vector.
+    fused_scores = dense_weight * min_max_normalize_np(
+        np.asarray(dense_scores, dtype=np.float64)
+    ) + bm25_weight * min_max_normalize_np(np.asarray(bm25_scores, dtype=np.float64))
 
-    ranked = sorted(
-        zip(chunks, fused_scores, dense_scores, bm25_scores),
-        key=lambda item: item[1],
-        reverse=True,
-    )
-    resolved_top_k = max(1, top_k)
+    # Selecting the k winners with argpartition is O(n); only that slice is
+    # then sorted. The stable sort keeps original chunk order on tied scores,
+    # matching the previous sorted(..., reverse=True) behavior.
+    k = min(max(1, top_k), len(chunks))
+    if k < len(chunks):
+        candidates = np.argpartition(-fused_scores, k - 1)[:k]
+        top_indices = candidates[np.argsort(-fused_scores[candidates], kind="stable")]
+    else:
+        top_indices = np.argsort(-fused_scores, kind="stable")
 
     return [
         RetrievedChunk(
-            chunk=chunk,
-            score=float(fused),
+            chunk=chunks[idx],
+            score=float(fused_scores[idx]),
             retrieval_detail={
-                "dense_score": round(float(dense), 4),
-                "bm25_score": round(float(bm25), 4),
-                "fused_score": round(float(fused), 4),
+                "dense_score": round(float(dense_scores[idx]), 4),
+                "bm25_score": round(float(bm25_scores[idx]), 4),
+                "fused_score": round(float(fused_scores[idx]), 4),
             },
         )
-        for chunk, fused, dense, bm25 in ranked[:resolved_top_k]
+        for idx in top_indices
     ]
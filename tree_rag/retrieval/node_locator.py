@@ -63,10 +63,22 @@ def _leaf_nodes(tree_data: dict[str, Any]) -> list[dict[str, Any]]:
     return leaves
 
 
+# One-slot cache keyed by tree identity: interactive sessions serialize the
+# same (immutable after build) tree for every query. Holding the tree itself
+# makes the identity check safe against id() reuse.
+_SERIALIZE_CACHE: tuple[dict[str, Any], str] | None = None
+
+
 def serialize_tree(tree_data: dict[str, Any]) -> str:
-    lines = ["Document Structure:"]
+    global _SERIALIZE_CACHE
+    cached = _SERIALIZE_CACHE
+    if cached is not None and cached[0] is tree_data:
+        return cached[1]
 
-    def visit(node: dict[str, Any], depth: int) -> None:
+    lines = ["Document Structure:"]
+    stack: list[tuple[dict[str, Any], int]] = [(tree_data.get("tree", {}), 0)]
+    while stack:
+        node, depth = stack.pop()
         if node.get("node_id") != "root":
             mark = " (Leaf Node)" if node.get("is_leaf", not node.get("children")) else ""
             heading = node.get("heading", "")
@@ -76,22 +88,53 @@ def serialize_tree(tree_data: dict[str, Any]) -> str:
             lines.append(f"{indent}[{node_id}] {heading}{mark}")
             if summary:
                 lines.append(f"{indent}  Summary: {summary}")
-        for child in node.get("children", []):
-            visit(child, depth + 1)
+        children = node.get("children", [])
+        if isinstance(children, list):
+            for child in reversed(children):
+                stack.append((child, depth + 1))
+
+    serialized = "\n".join(lines)
+    _SERIALIZE_CACHE = (tree_data, serialized)
+    return serialized
+
 
-    visit(tree_data.get("tree", {}), 0)
-    return "\n".join(lines)
+# One-slot cache of per-leaf match features (token set, lowered text) for the
+# keyword fallback, keyed by tree identity like _SERIALIZE_CACHE: the tree is
+# immutable after build, so repeated queries reuse the tokenization.
+_LEAF_FEATURE_CACHE: tuple[
+    dict[str, Any], list[tuple[dict[str, Any], frozenset[str], str]]
+] | None = None
 
 
-def _keyword_locate(query: str, tree_data: dict[str, Any], top_k: int) -> tuple[list[NodeLocateResult], str]:
+def _leaf_features(
+    tree_data: dict[str, Any], leaves: list[dict[str, Any]]
+) -> list[tuple[dict[str, Any], frozenset[str], str]]:
+    global _LEAF_FEATURE_CACHE
+    cached = _LEAF_FEATURE_CACHE
+    if cached is not None and cached[0] is tree_data:
+        return cached[1]
+
+    features: list[tuple[dict[str, Any], frozenset[str], str]] = []
+    for node in leaves:
+        text = f"{node.get('heading', '')} {node.get('summary', '')}".strip()
+        features.append((node, frozenset(tokenize(text)), text.lower()))
+    _LEAF_FEATURE_CACHE = (tree_data, features)
+    return features
+
+
+def _keyword_locate(
+    query: str,
+    tree_data: dict[str, Any],
+    top_k: int,
+    leaves: list[dict[str, Any]] | None = None,
+) -> tuple[list[NodeLocateResult], str]:
+    if leaves is None:
+        leaves = _leaf_nodes(tree_data)
     query_tokens = set(tokenize(query))
     candidates: list[tuple[float, dict[str, Any]]] = []
-    for node in _leaf_nodes(tree_data):
-        text = f"{node.get('heading', '')} {node.get('summary', '')}".strip()
-        node_tokens = set(tokenize(text))
+    for node, node_tokens, lowered in _leaf_features(tree_data, leaves):
         overlap = len(query_tokens.intersection(node_tokens))
         substring_boost = 0.0
-        lowered = text.lower()
         for token in query_tokens:
             if token and token in lowered:
                 substring_boost += 0.25
@@ -133,9 +176,12 @@ def locate_nodes(
     top_k: int | None = None,
 ) -> tuple[list[NodeLocateResult], str]:
     resolved_top_k = max(1, min(top_k or config.top_k, 5))
+    # Walk the tree once; every path below (keyword fallback, leaf-id
+    # validation) reuses the same list.
+    leaves = _leaf_nodes(tree_data)
     if mock or client is None:
         LOGGER.info("Node locating is using keyword fallback (mock mode or missing client).")
-        return _keyword_locate(query=query, tree_data=tree_data, top_k=resolved_top_k)
+        return _keyword_locate(query=query, tree_data=tree_data, top_k=resolved_top_k, leaves=leaves)
 
     prompt = NODE_LOCATE_PROMPT.format(
         query=query,
@@ -158,9 +204,9 @@ def locate_nodes(
             "LLM node locating failed (%s). Falling back to keyword matching.",
             exc,
         )
-        return _keyword_locate(query=query, tree_data=tree_data, top_k=resolved_top_k)
+        return _keyword_locate(query=query, tree_data=tree_data, top_k=resolved_top_k, leaves=leaves)
 
-    leaf_ids = {str(node.get("node_id")) for node in _leaf_nodes(tree_data)}
+    leaf_ids = {str(node.get("node_id")) for node in leaves}
     raw_results = payload.get("results", [])
     results: list[NodeLocateResult] = []
     for item in raw_results:
@@ -176,7 +222,7 @@ def locate_nodes(
 
     if not results:
         LOGGER.warning("LLM node locating returned no valid leaf nodes. Falling back to keyword matching.")
-        return _keyword_locate(query=query, tree_data=tree_data, top_k=resolved_top_k)
+        return _keyword_locate(query=query, tree_data=tree_data, top_k=resolved_top_k, leaves=leaves)
 
     thinking = str(payload.get("thinking", "")).strip() or "LLM returned candidate nodes."
     return results, thinking
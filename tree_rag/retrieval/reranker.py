@@ -8,10 +8,29 @@ from typing import Iterable
 
 from tree_rag.types import RagConfig, RetrievedChunk
 from tree_rag.utils.openai_client import OpenAICompatibleClient
+from tree_rag.utils.ttl_cache import TTLCache
 
 
 LOGGER = logging.getLogger(__name__)
 
+# Cross-encoder scores depend only on the (model, query, document) pair, not
+# on the rest of the candidate list, so they are cached per chunk: repeated
+# pipeline runs — evaluation sweeps, interactive re-asks, fusion-weight
+# tweaks that reshuffle the candidate set — only pay for documents the
+# reranker has not seen with this query recently. Opt-in via
+# RAG_RERANK_CACHE_TTL (seconds); disabled by default so distinct runs stay
+# independent.
+_RERANK_CACHE: TTLCache | None = None
+
+
+def _rerank_cache(ttl_seconds: float) -> TTLCache | None:
+    if ttl_seconds <= 0:
+        return None
+    global _RERANK_CACHE
+    if _RERANK_CACHE is None or _RERANK_CACHE.ttl_seconds != ttl_seconds:
+        _RERANK_CACHE = TTLCache(max_items=4096, ttl_seconds=ttl_seconds)
+    return _RERANK_CACHE
+
 
 def _fused_score(item: RetrievedChunk) -> float:
     return float(item.retrieval_detail.get("fused_score", 0.0))
@@ -46,19 +65,42 @@ def _score_candidates(
     if mock or client is None:
         return retrieved_chunks
 
-    documents = [item.chunk.text for item in retrieved_chunks]
-    try:
-        scores = client.rerank(
-            model=config.rerank_model,
-            query=query,
-            documents=documents,
-            top_n=None,
+    cache = _rerank_cache(config.rerank_cache_ttl_seconds)
+    if cache is not None:
+        scores: list[float | None] = [
+            cache.get((config.rerank_model, query, item.chunk.chunk_id))
+            for item in retrieved_chunks
+        ]
+    else:
+        scores = [None] * len(retrieved_chunks)
+    missing = [idx for idx, score in enumerate(scores) if score is None]
+    if missing:
+        documents = [retrieved_chunks[idx].chunk.text for idx in missing]
+        try:
+            new_scores = client.rerank(
+                model=config.rerank_model,
+                query=query,
+                documents=documents,
+                top_n=None,
+            )
+            if len(new_scores) != len(missing):
+                raise RuntimeError("Rerank score length mismatch.")
+        except Exception as exc:
+            LOGGER.warning("Rerank failed, fallback to fused score: %s", exc)
+            return retrieved_chunks
+        for idx, score in zip(missing, new_scores):
+            scores[idx] = score
+            if cache is not None:
+                cache.set(
+                    (config.rerank_model, query, retrieved_chunks[idx].chunk.chunk_id),
+                    score,
+                )
+    if len(missing) < len(retrieved_chunks):
+        LOGGER.info(
+            "Rerank cache served %d/%d documents.",
+            len(retrieved_chunks) - len(missing),
+            len(retrieved_chunks),
         )
-        if len(scores) != len(retrieved_chunks):
-            raise RuntimeError("Rerank score length mismatch.")
-    except Exception as exc:
-        LOGGER.warning("Rerank failed, fallback to fused score: %s", exc)
-        return retrieved_chunks
 
     for item, score in zip(retrieved_chunks, scores):
         item.retrieval_detail["rerank_score"] = round(float(score), 4)
@@ -93,30 +135,34 @@ def _select_with_node_diversity(
     else:
         target_unique_nodes = 0
 
-    selected: list[RetrievedChunk] = []
-    selected_ids: set[int] = set()
+    # Selection works on positions in `ranked`, which is already in final key
+    # order: re-sorting the picked subset reduces to sorting its indices, so
+    # the second _sorted_chunks pass (and the id()-based seen set) is gone.
+    selected_indices: list[int] = []
+    picked = [False] * len(ranked)
     seeded_nodes: set[str] = set()
 
     if config.rerank_diversify and target_unique_nodes > 0:
-        for item in ranked:
+        for idx, item in enumerate(ranked):
             node_id = item.chunk.source_node_id
             if node_id in seeded_nodes:
                 continue
-            selected.append(item)
-            selected_ids.add(id(item))
+            selected_indices.append(idx)
+            picked[idx] = True
             seeded_nodes.add(node_id)
-            if len(seeded_nodes) >= target_unique_nodes or len(selected) >= k:
+            if len(seeded_nodes) >= target_unique_nodes or len(selected_indices) >= k:
                 break
 
-    for item in ranked:
-        if len(selected) >= k:
+    for idx in range(len(ranked)):
+        if len(selected_indices) >= k:
             break
-        if id(item) in selected_ids:
+        if picked[idx]:
             continue
-        selected.append(item)
-        selected_ids.add(id(item))
+        selected_indices.append(idx)
+        picked[idx] = True
 
-    selected = _sorted_chunks(selected)
+    selected_indices.sort()
+    selected = [ranked[idx] for idx in selected_indices]
     selected_unique_nodes = len({item.chunk.source_node_id for item in selected})
 
     LOGGER.info(
@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
+import logging
+
 from tree_rag.types import RagConfig, RetrievedChunk
 from tree_rag.utils.openai_client import OpenAICompatibleClient
 
 
+LOGGER = logging.getLogger(__name__)
+
+# Roughly 6k tokens at ~4 chars/token: keeps the evidence block inside common
+# context windows (minus the answer budget) without a tokenizer dependency.
+MAX_CONTEXT_CHARS = 24000
+
+
 SYNTHESIS_PROMPT = """Based on the evidence retrieved from the document, answer the user question.
 
 Rules:
@@ -23,12 +32,29 @@ Answer:
 """
 
 
-def build_context(retrieved_chunks: list[RetrievedChunk]) -> str:
+def build_context(
+    retrieved_chunks: list[RetrievedChunk],
+    max_context_chars: int = MAX_CONTEXT_CHARS,
+) -> str:
     parts: list[str] = []
+    used = 0
     for index, item in enumerate(retrieved_chunks, start=1):
-        parts.append(
+        block = (
             f"[Evidence{index}] Source: {item.chunk.heading_path}\n{item.chunk.text}"
         )
+        cost = len(block) + (2 if parts else 0)  # account for the joining "\n\n"
+        if parts and used + cost > max_context_chars:
+            # Chunks arrive rank-ordered, so dropping the tail keeps the best
+            # evidence and avoids paying for input the model would truncate.
+            LOGGER.warning(
+                "Context truncated: %d of %d evidence blocks fit the %d-char budget.",
+                len(parts),
+                len(retrieved_chunks),
+                max_context_chars,
+            )
+            break
+        parts.append(block)
+        used += cost
     return "\n\n".join(parts)
 
 
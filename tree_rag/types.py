@@ -5,24 +5,28 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class Chunk:
     chunk_id: str
     text: str
     source_node_id: str
     heading_path: str
-    embedding: list[float]
+    # A list while building; loaded indexes use float32 row views into the
+    # shared embeddings matrix to avoid N x d boxed Python floats.
+    embedding: list[float] | np.ndarray
 
 
-@dataclass
+@dataclass(slots=True)
 class RetrievedChunk:
     chunk: Chunk
     score: float
     retrieval_detail: dict[str, float] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeLocateResult:
     node_id: str
     sub_query: str
@@ -69,14 +73,22 @@ class RagConfig:
     bm25_weight: float
     rerank_diversify: bool
     rerank_min_unique_nodes: int
+    # Seconds to cache per-chunk rerank scores; 0 disables the cache.
+    rerank_cache_ttl_seconds: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexedNode:
     node_id: str
     heading_path: str
     chunks: list[Chunk]
     bm25_index: Any
+    # Filled lazily by the retriever on first query: chunk embeddings stacked
+    # row-wise as float32 plus their L2 norms, so repeated queries against the
+    # same node are a single matrix-vector product. A (0, 0) matrix marks
+    # nodes whose embeddings are ragged or empty and must use the scalar path.
+    embedding_matrix: np.ndarray | None = None
+    embedding_norms: np.ndarray | None = None
 
 
 @dataclass
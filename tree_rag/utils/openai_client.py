@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from http.client import IncompleteRead
 import json
 import logging
@@ -11,6 +12,18 @@ from urllib import error as urlerror
 from urllib.parse import urlsplit
 from urllib import request
 
+import numpy as np
+
+try:
+    # orjson parses response bytes directly in C; the stdlib fallback also
+    # accepts bytes but re-scans them in Python.
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
+    def _json_dumps(obj: dict) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 
 LOGGER = logging.getLogger(__name__)
 
@@ -35,7 +48,7 @@ class OpenAICompatibleClient:
             endpoint = path
         else:
             endpoint = f"{self.base_url}{path}"
-        data = json.dumps(payload).encode("utf-8")
+        data = _json_dumps(payload)
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
@@ -45,7 +58,7 @@ class OpenAICompatibleClient:
             req = request.Request(endpoint, data=data, headers=headers, method="POST")
             try:
                 with request.urlopen(req, timeout=self.timeout_seconds) as response:
-                    body = response.read().decode("utf-8")
+                    body = response.read()
             except urlerror.HTTPError as exc:
                 details = exc.read().decode("utf-8", errors="ignore")
                 # Retry only for transient server-side errors.
@@ -82,8 +95,8 @@ class OpenAICompatibleClient:
                 raise RuntimeError(f"Request failed: {exc}") from exc
 
             try:
-                return json.loads(body)
-            except json.JSONDecodeError as exc:
+                return _json_loads(body)
+            except ValueError as exc:
                 # Retry for possibly truncated payloads on unstable connections.
                 if attempt < self.max_retries:
                     wait_seconds = self.retry_backoff_seconds * (2 ** (attempt - 1))
@@ -190,7 +203,60 @@ class OpenAICompatibleClient:
             raise RuntimeError("Invalid embeddings response format.") from exc
         return vectors
 
-    def rerank(self, model: str, query: str, documents: list[str], top_n: int | None = None) -> list[float]:
+    def embeddings_array(self, model: str, texts: list[str]) -> np.ndarray:
+        """Embeddings as one float32 matrix of shape (len(texts), dim).
+
+        One C-level conversion of the parsed response replaces per-value
+        Python float boxing — the difference is millions of allocations for
+        document-scale batches.
+        """
+        payload = {"model": model, "input": texts}
+        data = self._post_json("/embeddings", payload)
+        try:
+            matrix = np.asarray(
+                [item["embedding"] for item in data["data"]], dtype=np.float32
+            )
+        except (KeyError, TypeError, ValueError) as exc:
+            raise RuntimeError("Invalid embeddings response format.") from exc
+        if matrix.ndim != 2:
+            raise RuntimeError("Invalid embeddings response format.")
+        return matrix
+
+    def rerank(
+        self,
+        model: str,
+        query: str,
+        documents: list[str],
+        top_n: int | None = None,
+        batch_size: int | None = None,
+        max_workers: int = 4,
+    ) -> list[float]:
+        """Score documents against the query, optionally in concurrent batches.
+
+        With batch_size set and more documents than fit one request, batches
+        are scored in parallel threads and merged in input order; a failing
+        batch fails the whole call, matching single-request semantics.
+        """
+        if batch_size is None or len(documents) <= batch_size:
+            return self._rerank_once(model, query, documents, top_n)
+
+        batches = [
+            documents[start : start + batch_size]
+            for start in range(0, len(documents), batch_size)
+        ]
+        # top_n is a truncation hint that cannot be pushed into partial
+        # batches, so batched calls always score everything.
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+            futures = [
+                executor.submit(self._rerank_once, model, query, batch, None)
+                for batch in batches
+            ]
+            scores: list[float] = []
+            for future in futures:
+                scores.extend(future.result())
+        return scores
+
+    def _rerank_once(self, model: str, query: str, documents: list[str], top_n: int | None = None) -> list[float]:
         if self._is_dashscope_host():
             resolved_top_n = top_n if top_n is not None else len(documents)
             payload = {
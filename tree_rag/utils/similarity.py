@@ -2,27 +2,64 @@
 
 from __future__ import annotations
 
-import math
+import numpy as np
 
 
-def cosine_similarity(vec_a: list[float], vec_b: list[float]) -> float:
-    if not vec_a or not vec_b or len(vec_a) != len(vec_b):
+def cosine_similarity(
+    vec_a: list[float] | np.ndarray, vec_b: list[float] | np.ndarray
+) -> float:
+    # len() works for both lists and ndarray rows from a loaded index;
+    # truthiness does not (ambiguous for arrays).
+    if len(vec_a) == 0 or len(vec_b) == 0 or len(vec_a) != len(vec_b):
         return 0.0
 
-    dot = sum(a * b for a, b in zip(vec_a, vec_b))
-    norm_a = math.sqrt(sum(a * a for a in vec_a))
-    norm_b = math.sqrt(sum(b * b for b in vec_b))
-    if norm_a == 0.0 or norm_b == 0.0:
+    array_a = np.asarray(vec_a, dtype=np.float64)
+    array_b = np.asarray(vec_b, dtype=np.float64)
+    norm = np.linalg.norm(array_a) * np.linalg.norm(array_b)
+    if norm == 0.0:
         return 0.0
-    return dot / (norm_a * norm_b)
+    return float(array_a @ array_b / norm)
+
+
+def cosine_similarity_batch(
+    query: np.ndarray,
+    matrix: np.ndarray,
+    matrix_norms: np.ndarray | None = None,
+) -> np.ndarray:
+    """Cosine similarity of one query vector against every row of a matrix.
+
+    One matrix-vector product replaces per-row Python dot products. Callers
+    scoring the same matrix repeatedly can pass precomputed row norms to
+    amortize them across queries. Zero-norm rows and a zero-norm query score
+    0.0, matching cosine_similarity.
+    """
+    rows = matrix.shape[0]
+    query_norm = np.linalg.norm(query)
+    if rows == 0 or query_norm == 0.0:
+        return np.zeros(rows, dtype=np.float64)
+    if matrix_norms is None:
+        matrix_norms = np.linalg.norm(matrix, axis=1)
+    denom = matrix_norms * query_norm
+    return np.divide(
+        matrix @ query,
+        denom,
+        out=np.zeros(rows, dtype=np.float64),
+        where=denom > 0.0,
+    )
+
+
+def min_max_normalize_np(array: np.ndarray) -> np.ndarray:
+    """Array-in, array-out min-max normalization without list round-trips."""
+    if array.size == 0:
+        return array
+    minimum = array.min()
+    maximum = array.max()
+    if maximum == minimum:
+        return np.zeros_like(array)
+    return (array - minimum) / (maximum - minimum)
 
 
 def min_max_normalize(values: list[float]) -> list[float]:
     if not values:
         return []
-    minimum = min(values)
-    maximum = max(values)
-    if maximum == minimum:
-        return [0.0 for _ in values]
-    gap = maximum - minimum
-    return [(value - minimum) / gap for value in values]
+    return min_max_normalize_np(np.asarray(values, dtype=float)).tolist()
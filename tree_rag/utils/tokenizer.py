@@ -7,7 +7,8 @@ import re
 
 EN_TOKEN_RE = re.compile(r"[A-Za-z0-9_]+")
 CJK_CHAR_RE = re.compile(r"[\u4e00-\u9fff]")
-STOPWORDS = {
+CJK_RUN_RE = re.compile(r"[\u4e00-\u9fff]+")
+STOPWORDS = frozenset({
     "the",
     "a",
     "an",
@@ -21,7 +22,7 @@ STOPWORDS = {
     "on",
     "for",
     "with",
-}
+})
 
 
 def _contains_cjk(text: str) -> bool:
@@ -29,18 +30,19 @@ def _contains_cjk(text: str) -> bool:
 
 
 def _tokenize_cjk_fallback(text: str) -> list[str]:
+    # One finditer sweep over CJK runs partitions the string at C speed;
+    # the per-character Python loop and its accumulator list are gone.
+    # CJK characters still tokenize individually, as before.
     tokens: list[str] = []
-    word: list[str] = []
-    for ch in text:
-        if CJK_CHAR_RE.match(ch):
-            if word:
-                tokens.extend(EN_TOKEN_RE.findall("".join(word).lower()))
-                word = []
-            tokens.append(ch)
-            continue
-        word.append(ch)
-    if word:
-        tokens.extend(EN_TOKEN_RE.findall("".join(word).lower()))
+    prev = 0
+    for match in CJK_RUN_RE.finditer(text):
+        start, end = match.start(), match.end()
+        if start > prev:
+            tokens.extend(EN_TOKEN_RE.findall(text[prev:start].lower()))
+        tokens.extend(text[start:end])
+        prev = end
+    if prev < len(text):
+        tokens.extend(EN_TOKEN_RE.findall(text[prev:].lower()))
     return tokens
 
 
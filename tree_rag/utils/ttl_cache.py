@@ -0,0 +1,42 @@
+"""Small LRU cache with per-entry expiry for memoizing remote API results."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import time
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """Bounded mapping whose entries expire ttl_seconds after insertion.
+
+    Reads refresh LRU order but not expiry; when the cache is full the least
+    recently used entry is evicted. Intended for single-threaded memoization
+    of expensive remote calls.
+    """
+
+    def __init__(self, max_items: int = 1024, ttl_seconds: float = 300.0) -> None:
+        self.max_items = max(1, max_items)
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        entries = self._entries
+        entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        entries.move_to_end(key)
+        while len(entries) > self.max_items:
+            entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)